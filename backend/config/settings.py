@@ -98,12 +98,35 @@ DATABASES = {
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
         'CONN_MAX_AGE': 600,  # Keep connection alive for 10 minutes
+        'CONN_HEALTH_CHECKS': True,  # Verify a reused connection before a request/job uses it
         'OPTIONS': {
             'connect_timeout': 10,
         }
     }
 }
 
+# Optional read replica for read-only lookups (e.g. wallet existence checks).
+# Only configured when DB_REPLICA_HOST is set; otherwise reads stay on default.
+if os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': os.getenv('DB_REPLICA_NAME', DATABASES['default']['NAME']),
+        'USER': os.getenv('DB_REPLICA_USER', DATABASES['default']['USER']),
+        'PASSWORD': os.getenv('DB_REPLICA_PASSWORD', DATABASES['default']['PASSWORD']),
+        'HOST': os.getenv('DB_REPLICA_HOST'),
+        'PORT': os.getenv('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'connect_timeout': 10,
+        },
+        'TEST': {
+            'MIRROR': 'default',
+        }
+    }
+
+READ_REPLICA_DATABASE = 'replica' if 'replica' in DATABASES else 'default'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
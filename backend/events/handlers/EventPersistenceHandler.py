@@ -11,6 +11,8 @@ from events.pojos.Event import Event
 from markets.models import Market as MarketModel
 from markets.pojos.Market import Market
 
+_ZERO = Decimal('0')
+
 
 class EventPersistenceHandler:
 
@@ -172,12 +174,12 @@ class EventPersistenceHandler:
                 platformeventid=0,
                 title=eventPojo.eventSlug,
                 description="",
-                liquidity=Decimal('0'),
-                volume=Decimal('0'),
-                openInterest=Decimal('0'),
+                liquidity=_ZERO,
+                volume=_ZERO,
+                openInterest=_ZERO,
                 marketcreatedat=timezone.now(),
                 marketupdatedat=timezone.now(),
-                competitive=Decimal('0'),
+                competitive=_ZERO,
                 negrisk=0,
                 startdate=timezone.now(),
                 platform='polymarket'
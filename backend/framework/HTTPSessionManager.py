@@ -2,6 +2,7 @@
 Manager for HTTP sessions with connection pooling.
 """
 import logging
+import threading
 from typing import Dict
 import requests
 from requests.adapters import HTTPAdapter
@@ -19,6 +20,7 @@ class HTTPSessionManager:
     """
 
     _sessions: Dict[str, requests.Session] = {}
+    _lock = threading.Lock()  # Handlers are built on worker threads; one pool per key
 
     @classmethod
     def getSession(cls, sessionKey: str = "default") -> requests.Session:
@@ -31,10 +33,14 @@ class HTTPSessionManager:
         Returns:
             Configured requests.Session instance
         """
-        if sessionKey not in cls._sessions:
-            cls._sessions[sessionKey] = cls._createSession()
+        session = cls._sessions.get(sessionKey)
+        if session is None:
+            with cls._lock:
+                session = cls._sessions.get(sessionKey)
+                if session is None:
+                    session = cls._sessions[sessionKey] = cls._createSession()
 
-        return cls._sessions[sessionKey]
+        return session
 
     @classmethod
     def _createSession(cls) -> requests.Session:
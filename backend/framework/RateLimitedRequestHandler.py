@@ -96,8 +96,9 @@ class RateLimitedRequestHandler:
             try:
                 # Acquire rate limit token (wait if limit reached)
                 while not self.limiter.try_acquire(url, weight=1):
-                    # Rate limited - wait a short time before retrying
-                    time.sleep(0.1)  # 100ms
+                    # Rate limited - sleep until the bucket should have a free slot.
+                    # Sleeping here, not in the limiter, keeps its lock free for other threads.
+                    time.sleep(self._getRefillDelaySeconds(url))
 
                 RateLimitMetrics.incrementActiveRequests(self.limiterType)
 
@@ -135,6 +136,28 @@ class RateLimitedRequestHandler:
         # Execute request with retries
         return _executeRequest()
 
+    def _getRefillDelaySeconds(self, name: str) -> float:
+        """
+        Estimate how long until the limiter's bucket can admit one more request.
+
+        Reads the bucket under the limiter's lock (no sleeping there) so the estimate
+        matches the put that just failed as closely as possible.
+
+        Args:
+            name: Rate item name used for try_acquire
+
+        Returns:
+            Delay in seconds (at least 10ms; 100ms if the bucket cannot tell)
+        """
+        with self.limiter.lock:
+            item = self.limiter.bucket_factory.wrap_item(name, 1)
+            bucket = self.limiter.bucket_factory.get(item)
+            delayMs = bucket.waiting(item)
+
+        if not isinstance(delayMs, int) or delayMs < 0:
+            return 0.1  # 100ms
+        return max(delayMs, 10) / 1000
+
     def _handleResponse(self, response: requests.Response, duration: float) -> requests.Response:
         """
         Handle response and record appropriate metrics.
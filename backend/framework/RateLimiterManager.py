@@ -2,6 +2,7 @@
 Factory and manager for creating and managing rate limiters.
 """
 import logging
+import threading
 from typing import Dict
 from pyrate_limiter import Duration, Rate, Limiter
 from pyrate_limiter.buckets import InMemoryBucket
@@ -16,6 +17,7 @@ class RateLimiterManager:
     """Factory and manager for creating and managing rate limiters."""
 
     _limiters: Dict[RateLimiterType, Limiter] = {}
+    _lock = threading.Lock()  # A duplicate limiter would silently double the allowed rate
 
     @classmethod
     def getRateLimiter(cls, limiterType: RateLimiterType) -> Limiter:
@@ -29,10 +31,14 @@ class RateLimiterManager:
         Returns:
             Configured Limiter instance
         """
-        if limiterType not in cls._limiters:
-            cls._limiters[limiterType] = cls._createRateLimiter(limiterType)
+        limiter = cls._limiters.get(limiterType)
+        if limiter is None:
+            with cls._lock:
+                limiter = cls._limiters.get(limiterType)
+                if limiter is None:
+                    limiter = cls._limiters[limiterType] = cls._createRateLimiter(limiterType)
 
-        return cls._limiters[limiterType]
+        return limiter
 
     @classmethod
     def _createRateLimiter(cls, limiterType: RateLimiterType) -> Limiter:
@@ -101,7 +101,7 @@ class Market:
     
     def getTotalTradesCount(self) -> int:
         """Get total number of aggregated trades across all dates"""
-        return sum(len(daily.getAllTrades()) for daily in self.dailyTrades.values())
+        return sum(daily.getTradeCount() for daily in self.dailyTrades.values())
     
     def getTotalTransactionsCount(self) -> int:
         """Get total number of individual transactions across all dates"""
@@ -21,6 +21,8 @@ from django.db import connection
 from typing import Dict, List, Tuple
 from wallets.services.WalletPersistenceService import WalletPersistenceService
 
+_ZERO = Decimal('0')
+
 
 class PositionPersistenceHandler:
     @staticmethod
@@ -47,11 +49,11 @@ class PositionPersistenceHandler:
                             averageentryprice=positionPojo.averageEntryPrice,
                             amountspent=positionPojo.amountSpent,
                             amountremaining=positionPojo.amountRemaining,
-                            calculatedamountinvested=Decimal('0'),
-                            calculatedcurrentvalue=Decimal('0'),
-                            calculatedamountout=Decimal('0'),
-                            realizedpnl=Decimal('0'),
-                            unrealizedpnl=Decimal('0'),
+                            calculatedamountinvested=_ZERO,
+                            calculatedcurrentvalue=_ZERO,
+                            calculatedamountout=_ZERO,
+                            realizedpnl=_ZERO,
+                            unrealizedpnl=_ZERO,
                             apirealizedpnl=positionPojo.apiRealizedPnl,
                             enddate=positionPojo.endDate,
                             negativerisk=positionPojo.negativeRisk
@@ -410,7 +412,7 @@ class PositionPersistenceHandler:
                 position.averageentryprice = positionPojo.averageEntryPrice
                 position.amountspent = positionPojo.amountSpent
                 position.amountremaining = positionPojo.amountRemaining
-                position.apirealizedpnl = positionPojo.apiRealizedPnl if positionPojo.apiRealizedPnl else Decimal('0')
+                position.apirealizedpnl = positionPojo.apiRealizedPnl if positionPojo.apiRealizedPnl else _ZERO
                 
                 # Set final closed status
                 position.positionstatus = PositionStatus.CLOSED.value
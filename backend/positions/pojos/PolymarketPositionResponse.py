@@ -7,7 +7,7 @@ from typing import Optional
 from positions.enums.PositionStatus import PositionStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class PolymarketPositionResponse:
     """
     Represents a position response from Polymarket API.
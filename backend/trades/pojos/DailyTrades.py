@@ -2,9 +2,10 @@
 POJO for organizing trades by date with proper segregation by type.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from datetime import date
 from collections import defaultdict
+from itertools import chain
 from decimal import Decimal
 
 from trades.enums.TradeType import TradeType
@@ -130,10 +131,15 @@ class DailyTrades:
     
     def getAllTrades(self) -> List[AggregatedTrade]:
         """Get all aggregated trades for this date as a flat list"""
-        allTrades = []
-        for tradeList in self.tradesByType.values():
-            allTrades.extend(tradeList)
-        return allTrades
+        return list(self.iterTrades())
+    
+    def iterTrades(self) -> Iterator[AggregatedTrade]:
+        """Iterate all aggregated trades for this date without building a list"""
+        return chain.from_iterable(self.tradesByType.values())
+    
+    def getTradeCount(self) -> int:
+        """Get number of aggregated trades for this date"""
+        return sum(len(tradeList) for tradeList in self.tradesByType.values())
     
     def setMarketPk(self, marketPk: int) -> None:
         """Set the market primary key for database persistence"""
@@ -145,9 +151,9 @@ class DailyTrades:
     
     def getTotalTransactions(self) -> int:
         """Get total number of individual transactions for this date"""
-        return sum(trade.transactionCount for trade in self.getAllTrades())
+        return sum(trade.transactionCount for trade in self.iterTrades())
     
     def __str__(self):
-        tradeCount = len(self.getAllTrades())
+        tradeCount = self.getTradeCount()
         transactionCount = self.getTotalTransactions()
         return f"DailyTrades[W:{self.walletId} M:{self.marketId} {self.tradeDate}]: {tradeCount} aggregated trades, {transactionCount} transactions"
\ No newline at end of file
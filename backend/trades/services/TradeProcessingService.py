@@ -187,7 +187,7 @@ class TradeProcessingService:
         # Collect all aggregated trades (already in persistence format!)
         allTrades = []
         for dailyTrades in market.dailyTrades.values():
-            allTrades.extend(dailyTrades.getAllTrades())
+            allTrades.extend(dailyTrades.iterTrades())
         
         # Add directly to persistence (no conversion needed!)
         if allTrades:
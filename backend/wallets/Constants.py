@@ -2,6 +2,7 @@
 Global constants for Smart Money Wallets functionality.
 Platform-specific constants are in their respective implementation folders.
 """
+import os
 from decimal import Decimal
 
 # Platform Identifiers
@@ -31,7 +32,11 @@ MAX_CLOSED_POSITIONS = 1500
 
 # Parallel Processing Constants
 SMART_WALLET_DISCOVERY = "smartWalletDiscovery"
-PARALLEL_WALLET_WORKERS = 30
+PARALLEL_WALLET_WORKERS = int(os.getenv('PARALLEL_WALLET_WORKERS', '30'))  # I/O bound evaluation pool
+CANDIDATE_QUEUE_SIZE = 64  # Leaderboard candidates buffered ahead of evaluation
+LEADERBOARD_PAGE_LIMIT = 50  # Leaderboard rows per request; the API caps limit at 50
+LEADERBOARD_PREFETCH_DEPTH = 4  # Leaderboard pages requested ahead within one category
+WALLET_BULK_BATCH_SIZE = 500  # Rows per INSERT in wallet persistence bulk_create calls
 PARALLEL_PNL_SCHEDULER_WORKERS = 50
 PARALLEL_POSITION_UPDATE_WORKERS = 30
 PARALLEL_EVENT_UPDATE_WORKERS = 30
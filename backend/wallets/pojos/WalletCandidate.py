@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletCandidate:
     """Represents a candidate wallet from leaderboard."""
 
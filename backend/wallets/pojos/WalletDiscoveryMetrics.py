@@ -4,6 +4,7 @@ Encapsulates all metric tracking logic for clean, modular code.
 Thread-safe for parallel processing.
 """
 from dataclasses import dataclass, field
+from collections import Counter
 from typing import Dict
 import threading
 
@@ -21,7 +22,7 @@ class WalletDiscoveryMetrics:
     rejectedCount: int = 0
     successfullyPersisted: int = 0
     positionsPersisted: int = 0
-    rejectionReasons: Dict[str, int] = field(default_factory=dict)
+    rejectionReasons: Dict[str, int] = field(default_factory=Counter)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def incrementProcessed(self) -> None:
@@ -37,10 +38,11 @@ class WalletDiscoveryMetrics:
                 self.positionsPersisted += positionCount
 
     def recordRejected(self, failReason: str) -> None:
-        """Record a wallet rejection with reason (thread-safe)."""
+        """Record a wallet rejection with reason (thread-safe; the reason is parsed before taking the lock)."""
+        reasonKey = self._extractReasonKey(failReason)
         with self._lock:
             self.rejectedCount += 1
-            self._trackRejectionReason(failReason)
+            self._trackRejectionReason(reasonKey)
 
     def recordPersisted(self, walletCount: int = 1) -> None:
         """Record successful wallet persistence (thread-safe)."""
@@ -53,11 +55,14 @@ class WalletDiscoveryMetrics:
             self.rejectedCount += 1
             self._trackRejectionReason("processing_error")
 
-    def _trackRejectionReason(self, failReason: str) -> None:
-        """Extract and track rejection reason (called within lock)."""
-        # Extract key from reason (e.g., "Insufficient activity | ..." -> "activity")
-        reasonKey = failReason.split(' |')[0].replace('Insufficient ', '').lower()
-        self.rejectionReasons[reasonKey] = self.rejectionReasons.get(reasonKey, 0) + 1
+    def _trackRejectionReason(self, reasonKey: str) -> None:
+        """Count one rejection under its reason key (called within lock)."""
+        self.rejectionReasons[reasonKey] += 1
+
+    @staticmethod
+    def _extractReasonKey(failReason: str) -> str:
+        """Extract key from reason (e.g., "Insufficient activity | ..." -> "activity")."""
+        return failReason.split(' |', 1)[0].removeprefix('Insufficient ').lower()
 
     def toDict(self) -> dict:
         """Convert metrics to dictionary format."""
@@ -67,7 +72,7 @@ class WalletDiscoveryMetrics:
             'rejectedCount': self.rejectedCount,
             'successfullyPersisted': self.successfullyPersisted,
             'positionsPersisted': self.positionsPersisted,
-            'rejectionReasons': self.rejectionReasons
+            'rejectionReasons': dict(self.rejectionReasons)
         }
 
     @classmethod
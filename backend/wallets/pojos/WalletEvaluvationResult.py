@@ -7,7 +7,7 @@ from typing import Optional, Dict
 from wallets.pojos.WalletCandidate import WalletCandidate
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletEvaluvationResult:
     """Result of wallet evaluation with minimal essential data."""
 
@@ -4,6 +4,8 @@ Pure functions with no scheduler dependencies.
 """
 import logging
 
+from django.db import close_old_connections
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +15,10 @@ def discoverAndFilterWallets():
     Uses new market-level PNL calculation to fix merge/split corruption bug.
     Pure function - no scheduler coupling.
     """
+    # Scheduler jobs run outside the request cycle, so apply CONN_MAX_AGE /
+    # CONN_HEALTH_CHECKS here: reuse the persistent connection across the run,
+    # drop it first if it has expired or gone bad
+    close_old_connections()
     try:
         from wallets.services.SmartWalletDiscoveryService import SmartWalletDiscoveryService
         
@@ -35,4 +41,7 @@ def discoverAndFilterWallets():
             str(e),
             exc_info=True
         )
-        raise
\ No newline at end of file
+        raise
+
+    finally:
+        close_old_connections()
\ No newline at end of file
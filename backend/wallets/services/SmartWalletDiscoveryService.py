@@ -5,14 +5,18 @@ Main entry point for discovering and processing smart money wallets from leaderb
 Flow:
 1. Fetch wallet candidates from leaderboard API
 2. Evaluate each candidate through filtering pipeline (in parallel)
-3. Persist wallets that pass filtering with complete hierarchy (with locking)
+3. Persist wallets that passed evaluation with complete hierarchy (wallet rows locked per transaction)
 4. Track and report metrics
 """
+import itertools
 import logging
+import threading
 import time
-from typing import List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
+from queue import Queue, Full
+from typing import Iterable, Iterator, List
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from django.conf import settings
+from django.db import connections
 
 from wallets.smartwalletdiscovery.WalletEvaluvationService import WalletEvaluvationService
 from wallets.services.WalletPersistenceService import WalletPersistenceService
@@ -21,11 +25,13 @@ from wallets.pojos.WalletDiscoveryResult import WalletDiscoveryResult
 from wallets.pojos.WalletDiscoveryMetrics import WalletDiscoveryMetrics
 from wallets.smartwalletdiscovery.WalletCandidateFetcher import WalletCandidateFetcher
 from wallets.pojos.WalletEvaluvationResult import WalletEvaluvationResult
-from wallets.Constants import PARALLEL_WALLET_WORKERS
+from wallets.Constants import PARALLEL_WALLET_WORKERS, CANDIDATE_QUEUE_SIZE
 from wallets.models import Wallet
 
 logger = logging.getLogger(__name__)
 
+_END_OF_CANDIDATES = object()  # Queue sentinel marking the end of the leaderboard stream
+
 
 class SmartWalletDiscoveryService:
     """
@@ -39,41 +45,27 @@ class SmartWalletDiscoveryService:
     """
 
     def __init__(self):
+        self.candidateFetcher = WalletCandidateFetcher()
         self.evaluvationService = WalletEvaluvationService()
         self.persistenceService = WalletPersistenceService()
+        self._errorCounter = itertools.count()
 
     def filterWalletsFromLeaderboard(self, minPnl: float = 20000) -> WalletDiscoveryResult:
-        startTime = time.time()
+        startNs = time.monotonic_ns()  # Monotonic: immune to wall-clock jumps during long runs
 
         try:
             logger.info("SMART_WALLET_DISCOVERY :: Starting pipeline | MinPNL: %.0f", minPnl)
 
-            # Step 1: Fetch candidates from leaderboard
-            candidateFetcher = WalletCandidateFetcher()
-            candidates = candidateFetcher.fetchCandidates(minPnl=minPnl)
+            # Steps 1-3: Stream leaderboard candidates (minus existing active wallets) into evaluation and persistence
+            metrics = self.processCandidates(self.streamCandidates(minPnl))
 
-            if not candidates:
-                logger.info("SMART_WALLET_DISCOVERY :: No candidates found from leaderboard")
-                executionTime = round(time.time() - startTime, 2)
+            if not metrics.totalProcessed:
+                logger.info("SMART_WALLET_DISCOVERY :: No new candidates found from leaderboard")
+                executionTime = round((time.monotonic_ns() - startNs) / 1e9, 2)
                 return WalletDiscoveryResult.empty(executionTime)
 
-            logger.info("SMART_WALLET_DISCOVERY :: Candidates fetched: %d", len(candidates))
-
-            # Step 2: Filter out wallets that already exist and are active
-            filteredCandidates = self.filterExistingActiveWallets(candidates)
-            
-            if not filteredCandidates:
-                logger.info("SMART_WALLET_DISCOVERY :: All candidates already exist as active wallets")
-                executionTime = round(time.time() - startTime, 2)
-                return WalletDiscoveryResult.empty(executionTime)
-
-            logger.info("SMART_WALLET_DISCOVERY :: After filtering existing active wallets: %d candidates remaining", len(filteredCandidates))
-
-            # Step 3: Process candidates through evaluation and persistence pipeline
-            metrics = self.processCandidates(filteredCandidates)
-
             # Step 4: Build response with metrics
-            executionTime = round(time.time() - startTime, 2)
+            executionTime = round((time.monotonic_ns() - startNs) / 1e9, 2)
 
             discoveryResult = WalletDiscoveryResult.success(
                 candidatesFound=metrics.totalProcessed,
@@ -82,7 +74,7 @@ class SmartWalletDiscoveryService:
                 walletsPersisted=metrics.successfullyPersisted,
                 positionsPersisted=metrics.positionsPersisted,
                 executionTimeSeconds=executionTime,
-                rejectionReasons=metrics.rejectionReasons
+                rejectionReasons=dict(metrics.rejectionReasons)
             )
 
             logger.info("SMART_WALLET_DISCOVERY :: Pipeline complete | Qualified: %d | Persisted: %d | Time: %.1fs",
@@ -93,63 +85,156 @@ class SmartWalletDiscoveryService:
             return discoveryResult
 
         except Exception as e:
-            executionTime = round(time.time() - startTime, 2)
-            logger.error("SMART_WALLET_DISCOVERY :: Pipeline failed: %s", str(e), exc_info=True)
+            executionTime = round((time.monotonic_ns() - startNs) / 1e9, 2)
+            logger.error("SMART_WALLET_DISCOVERY :: Pipeline failed: %s", e, exc_info=True)
             return WalletDiscoveryResult.failure(str(e), executionTime)
 
-    def processCandidates(self, candidates: List[WalletCandidate]) -> WalletDiscoveryMetrics:
-        logger.info("SMART_WALLET_DISCOVERY :: Processing %d candidates in parallel with %d workers",len(candidates), PARALLEL_WALLET_WORKERS)
+    def streamCandidates(self, minPnl: float) -> Iterator[WalletCandidate]:
+        """
+        Yield leaderboard candidates while later pages are still downloading.
+
+        A producer thread fetches pages, drops existing active wallets and feeds a bounded
+        queue, so fetch latency overlaps evaluation and a slow consumer applies backpressure.
+        Fetch errors are re-raised to the caller once the queue is drained.
+        """
+        candidateQueue: Queue = Queue(maxsize=CANDIDATE_QUEUE_SIZE)
+        stopEvent = threading.Event()
+        producerErrors: List[Exception] = []
+
+        def enqueue(item) -> bool:
+            while not stopEvent.is_set():
+                try:
+                    candidateQueue.put(item, timeout=1)
+                    return True
+                except Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            fetchedCount = 0
+            try:
+                for pageCandidates in self.candidateFetcher.fetchCandidatesIter(minPnl):
+                    fetchedCount += len(pageCandidates)
+                    for candidate in self.filterExistingActiveWallets(pageCandidates):
+                        if not enqueue(candidate):
+                            return
+                logger.info("SMART_WALLET_DISCOVERY :: Candidates fetched: %d", fetchedCount)
+            except Exception as e:
+                producerErrors.append(e)
+            finally:
+                # Close every alias this thread opened (default and the read replica used by filterExistingActiveWallets)
+                connections.close_all()
+                enqueue(_END_OF_CANDIDATES)
+
+        producer = threading.Thread(target=produce, name="SmartWalletCandidateProducer", daemon=True)
+        producer.start()
+
+        try:
+            while (candidate := candidateQueue.get()) is not _END_OF_CANDIDATES:
+                yield candidate
+        finally:
+            stopEvent.set()
+            producer.join()
+
+        if producerErrors:
+            raise producerErrors[0]
+
+    def processCandidates(self, candidates: Iterable[WalletCandidate]) -> WalletDiscoveryMetrics:
+        logger.info("SMART_WALLET_DISCOVERY :: Processing candidates in parallel with %d workers", PARALLEL_WALLET_WORKERS)
 
         metrics = WalletDiscoveryMetrics.create()
+        passedResults: List[WalletEvaluvationResult] = []
+        self._errorCounter = itertools.count()
+        maxInFlight = PARALLEL_WALLET_WORKERS * 2
 
-        # Process candidates in parallel using ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=PARALLEL_WALLET_WORKERS) as executor:
-            # Submit all candidates for processing
-            future_to_candidate = {
-                executor.submit(self.processSingleCandidate, candidate, metrics): candidate
-                for candidate in candidates
-            }
+        sourceError = None
 
-            # Wait for all tasks to complete
+        # Phase 1: Evaluate candidates in parallel (network bound)
+        with ThreadPoolExecutor(max_workers=PARALLEL_WALLET_WORKERS) as executor:
+            future_to_candidate = {}
+
+            try:
+                for candidate in candidates:
+                    # Bound in-flight evaluations so backpressure reaches the candidate source
+                    if len(future_to_candidate) >= maxInFlight:
+                        doneFutures, _ = wait(future_to_candidate, return_when=FIRST_COMPLETED)
+                        for future in doneFutures:
+                            self.collectEvaluation(future, future_to_candidate.pop(future), passedResults, metrics)
+
+                    future_to_candidate[executor.submit(self.evaluateSingleCandidate, candidate)] = candidate
+            except Exception as e:
+                # Candidate source (leaderboard fetch) failed: finish and persist what was already evaluated, then re-raise
+                sourceError = e
+                logger.info("SMART_WALLET_DISCOVERY :: Candidate stream failed, finishing submitted evaluations | In flight: %d | Error: %s", len(future_to_candidate), e)
+
+            # Collect remaining results as evaluations complete
             for future in as_completed(future_to_candidate):
-                candidate = future_to_candidate[future]
-                try:
-                    future.result()  # This will raise any exception that occurred during processing
-                except Exception as e:
-                    logger.info("SMART_WALLET_DISCOVERY :: Unexpected error in parallel processing | #%d | Wallet: %s | Error: %s",candidate.number, candidate.proxyWallet[:10], str(e))
-                    metrics.recordProcessingError()
+                self.collectEvaluation(future, future_to_candidate[future], passedResults, metrics)
+
+        # Phase 2: Bulk-persist passed wallets on this thread (one batch, so a few bulk statements per table)
+        if passedResults:
+            self.persistPassedResults(passedResults, metrics)
 
         logger.info("SMART_WALLET_DISCOVERY :: Batch complete | Processed: %d | Passed: %d | Persisted: %d",metrics.totalProcessed, metrics.passedEvaluation, metrics.successfullyPersisted)
+        if sourceError is not None:
+            raise sourceError
         return metrics
 
-    def processSingleCandidate(self, candidate: WalletCandidate, metrics: WalletDiscoveryMetrics) -> None:
+    def collectEvaluation(self, future: Future, candidate: WalletCandidate, passedResults: List[WalletEvaluvationResult], metrics: WalletDiscoveryMetrics) -> None:
+        """Fold one finished evaluation into metrics; only called from the submitting thread, so workers never touch counters."""
         metrics.incrementProcessed()
 
         try:
-            # Step 1: Evaluate wallet
-            evaluationResult = self.evaluvationService.evaluateWallet(candidate)
+            evaluationResult = future.result()  # This will raise any exception that occurred during evaluation
+        except Exception as e:
+            metrics.recordProcessingError()
+            logger.info("SMART_WALLET_DISCOVERY :: Error processing wallet | #%d | %s: %s",candidate.number, candidate.proxyWallet[:10], e, exc_info=self.shouldLogTraceback())
+            return
 
-            if evaluationResult.passed:
-                metrics.recordPassed(evaluationResult.positionCount)
+        if evaluationResult.passed:
+            metrics.recordPassed(evaluationResult.positionCount)
+            passedResults.append(evaluationResult)
+        else:
+            metrics.recordRejected(evaluationResult.failReason or "Unknown")
 
-                logger.info("SMART_WALLET_DISCOVERY :: PASSED | #%d | Wallet: %s | Trades: %d | PNL: %.2f",candidate.number, candidate.proxyWallet[:10], evaluationResult.tradeCount, float(evaluationResult.combinedPnl))
+    def evaluateSingleCandidate(self, candidate: WalletCandidate) -> WalletEvaluvationResult:
+        evaluationResult = self.evaluvationService.evaluateWallet(candidate)
+        shortAddress = candidate.proxyWallet[:10]
 
-                # Step 2: Persist wallet and hierarchy (with database lock)
-                persistedWallet = self.persistenceService.persistWallet(evaluationResult, candidate.number)
+        if evaluationResult.passed:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: PASSED | #%d | Wallet: %s | Trades: %d | PNL: %s",candidate.number, shortAddress, evaluationResult.tradeCount, format(evaluationResult.combinedPnl, '.2f'))
+        else:
+            logger.info("SMART_WALLET_DISCOVERY :: REJECTED | #%d | Wallet: %s | Reason: %s",candidate.number, shortAddress, evaluationResult.failReason)
 
-                if persistedWallet:
-                    metrics.recordPersisted(1)
-                    logger.info("SMART_WALLET_DISCOVERY :: PERSISTED | #%d | Wallet: %s | Categories: %s",candidate.number, candidate.proxyWallet[:10], persistedWallet.category or "None")
-                else:
-                    logger.info("SMART_WALLET_DISCOVERY :: Persistence failed | #%d | Wallet: %s",candidate.number, candidate.proxyWallet[:10])
+        return evaluationResult
 
-            else:
-                metrics.recordRejected(evaluationResult.failReason or "Unknown")
-                logger.info("SMART_WALLET_DISCOVERY :: REJECTED | #%d | Wallet: %s | Reason: %s",candidate.number, candidate.proxyWallet[:10], evaluationResult.failReason)
+    def shouldLogTraceback(self) -> bool:
+        """Full traceback for the first 3 errors of a run, then 1 in 100, so a systemic failure doesn't flood logs."""
+        errorNumber = next(self._errorCounter)  # itertools.count is atomic under the GIL
+        return errorNumber < 3 or errorNumber % 100 == 0
 
+    def persistPassedResults(self, passedResults: List[WalletEvaluvationResult], metrics: WalletDiscoveryMetrics) -> None:
+        try:
+            # Persist wallets and hierarchies in bulk (known wallet rows are locked with SELECT ... FOR NO KEY UPDATE)
+            persistedWallets = self.persistenceService.persistWallets(passedResults)
         except Exception as e:
-            metrics.recordProcessingError()
-            logger.info("SMART_WALLET_DISCOVERY :: Error processing wallet | #%d | %s: %s",candidate.number, candidate.proxyWallet[:10], str(e), exc_info=True)
+            logger.info("SMART_WALLET_DISCOVERY :: Error persisting wallets | Count: %d | Error: %s",len(passedResults), e, exc_info=True)
+            return
+
+        metrics.recordPersisted(len(persistedWallets))
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        for evaluationResult in passedResults:
+            candidate = evaluationResult.candidate
+            shortAddress = candidate.proxyWallet[:10]
+            persistedWallet = persistedWallets.get(candidate.proxyWallet)
+
+            if persistedWallet:
+                logger.info("SMART_WALLET_DISCOVERY :: PERSISTED | #%d | Wallet: %s | ID: %s | Categories: %s",candidate.number, shortAddress, persistedWallet.walletsid, persistedWallet.category or "None")
+            else:
+                logger.info("SMART_WALLET_DISCOVERY :: Persistence failed | #%d | Wallet: %s",candidate.number, shortAddress)
 
     def filterExistingActiveWallets(self, candidates: List[WalletCandidate]) -> List[WalletCandidate]:
         if not candidates:
@@ -163,8 +248,9 @@ class SmartWalletDiscoveryService:
             # This minimizes the result set size, reducing comparison time significantly
             # By querying only for active wallets, we avoid fetching unnecessary data
             # Query leverages index on proxywallet for fast lookups
+            # Pure read: served by the read replica when one is configured
             existingActiveAddresses = set(
-                Wallet.objects.filter(
+                Wallet.objects.using(settings.READ_REPLICA_DATABASE).filter(
                     proxywallet__in=candidateAddresses,
                     isactive=1
                 ).values_list('proxywallet', flat=True)
@@ -187,6 +273,6 @@ class SmartWalletDiscoveryService:
             return filteredCandidates
             
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Error filtering existing active wallets: %s", str(e), exc_info=True)
+            logger.info("SMART_WALLET_DISCOVERY :: Error filtering existing active wallets: %s", e, exc_info=True)
             # On error, return all candidates to avoid blocking the pipeline
             return candidates
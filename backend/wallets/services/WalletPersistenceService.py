@@ -8,28 +8,37 @@ Key Features:
 - Persists complete hierarchy: Wallet → Events → Markets → Positions → Trades
 - Atomic transactions with proper rollback
 - Bulk operations for performance
-- Thread-safe persistence with database locking
+- Concurrent runs serialized per wallet by row locks (SELECT ... FOR NO KEY UPDATE)
 """
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import time
+from dataclasses import replace
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 from decimal import Decimal
 from datetime import datetime
 from django.db import transaction
 from django.utils import timezone
 
-from wallets.models import Wallet, Lock, WalletPnl
+from wallets.models import Wallet, WalletPnl
 from wallets.enums import WalletType
-from wallets.Constants import SMART_WALLET_DISCOVERY
+from wallets.Constants import WALLET_BULK_BATCH_SIZE
 from events.models import Event as EventModel
 from markets.models import Market as MarketModel
 from positions.models import Position as PositionModel
 from trades.models import Trade, Batch
 from wallets.pojos.WalletEvaluvationResult import WalletEvaluvationResult
+from wallets.pojos.WalletCandidate import WalletCandidate
 from events.pojos.Event import Event
 from markets.pojos.Market import Market
 from positions.pojos.Position import Position
 
 logger = logging.getLogger(__name__)
+_ZERO = Decimal('0')  # Shared fallback for missing numeric fields (Decimal is immutable)
+
+# Columns handleExistingWallet reads or writes; lastupdatedat is loaded so save() still bumps it
+EXISTING_WALLET_FIELDS = ('walletsid', 'proxywallet', 'category', 'isactive', 'openpnl', 'closedpnl', 'pnl', 'lastupdatedat')
 
 
 class WalletPersistenceService:
@@ -38,79 +47,13 @@ class WalletPersistenceService:
     Supports multi-category wallets (one DB record per category).
     """
 
-    @staticmethod
-    def acquireLock(processName: str):
-        """
-        Acquire database lock for thread-safe persistence.
-
-        Behavior:
-        - Creates lock record if it doesn't exist
-        - Blocks (waits) if another process holds the lock
-        - Acquires lock once available
-
-        Args:
-            processName: Name of the process acquiring the lock
-
-        Returns:
-            Lock object with acquired lock
-        """
-        try:
-            with transaction.atomic():
-                # Try to acquire lock with select_for_update (blocks until available)
-                try:
-                    logger.info("SMART_WALLET_DISCOVERY :: Attempting to acquire lock | Process: %s", processName)
-
-                    # This blocks if another transaction has the lock
-                    lock = Lock.objects.select_for_update().get(id=1)
-
-                except Lock.DoesNotExist:
-                    # Lock record doesn't exist, create it
-                    logger.info("SMART_WALLET_DISCOVERY :: Lock record not found, creating | Process: %s", processName)
-                    lock = Lock.objects.create(id=1, processname=None)
-
-                # At this point, we have the lock (select_for_update waited if needed)
-                previousHolder = lock.processname
-                lock.processname = processName
-                lock.save()
-
-                if previousHolder:
-                    logger.info("SMART_WALLET_DISCOVERY :: Lock acquired (was held by: %s) | New holder: %s",
-                               previousHolder, processName)
-                else:
-                    logger.info("SMART_WALLET_DISCOVERY :: Lock acquired | Process: %s", processName)
-
-                return lock
-
-        except Exception as e:
-            logger.error("SMART_WALLET_DISCOVERY :: Failed to acquire lock | Process: %s | Error: %s",
-                        processName, str(e), exc_info=True)
-            raise
-
-    @staticmethod
-    def releaseLock(processName: str):
-        """
-        Release database lock after persistence is complete.
-        Clears the process name to indicate lock is available.
-
-        Args:
-            processName: Name of the process releasing the lock
-        """
-        try:
-            lock = Lock.objects.get(id=1)
-            lock.processname = None
-            lock.save()
-            logger.info("SMART_WALLET_DISCOVERY :: Lock released | Process: %s", processName)
-
-        except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Failed to release lock: %s", str(e), exc_info=True)
-
     @staticmethod
     def persistWallet(evaluationResult: WalletEvaluvationResult, candidateNumber: int) -> Optional[Wallet]:
         """
         Persist wallet with PnL calculated as a whole.
 
-        Flow:
-        1. Check if wallet exists in database
+        Flow (one transaction, serialized per wallet by a row lock instead of a global one):
+        1. Check if wallet exists in database (SELECT ... FOR NO KEY UPDATE)
         2. If exists and active → Update categories (merge)
         3. If exists and inactive → Reactivate and update categories
         4. If not exists → Persist new wallet with full hierarchy
@@ -129,21 +72,22 @@ class WalletPersistenceService:
             # Get categories as comma-separated string
             categories = WalletPersistenceService.getCategoriesFromCandidate(evaluationResult, candidateNumber)
 
-            # Check if wallet already exists
-            existingWallet = WalletPersistenceService.getExistingWallet(evaluationResult.walletAddress, candidateNumber)
-
-            # Handle existing vs new wallet
-            if existingWallet:
-                wallet = WalletPersistenceService.handleExistingWallet(
-                    existingWallet,
-                    evaluationResult.walletAddress,
-                    categories,
-                    evaluationResult.openPnl,
-                    evaluationResult.closedPnl,
-                    evaluationResult.combinedPnl
-                )
-            else:
-                wallet = WalletPersistenceService.persistNewWallet(evaluationResult, categories, candidateNumber)
+            with transaction.atomic():
+                # Check if wallet already exists, locking its row until commit
+                existingWallet = WalletPersistenceService.getExistingWallet(evaluationResult.walletAddress, candidateNumber)
+
+                # Handle existing vs new wallet
+                if existingWallet:
+                    wallet = WalletPersistenceService.handleExistingWallet(
+                        existingWallet,
+                        evaluationResult.walletAddress,
+                        categories,
+                        evaluationResult.openPnl,
+                        evaluationResult.closedPnl,
+                        evaluationResult.combinedPnl
+                    )
+                else:
+                    wallet = WalletPersistenceService.persistNewWallet(evaluationResult, categories, candidateNumber)
 
             if wallet:
                 logger.info("SMART_WALLET_DISCOVERY :: Complete | Wallet: %s | Categories: %s - #%d",wallet.proxywallet[:10], wallet.category or "None", candidateNumber)
@@ -151,9 +95,148 @@ class WalletPersistenceService:
             return wallet
 
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Failed | Wallet: %s | Error: %s - #%d",evaluationResult.walletAddress[:10], str(e), candidateNumber, exc_info=True)
+            logger.info("SMART_WALLET_DISCOVERY :: Failed | Wallet: %s | Error: %s - #%d",evaluationResult.walletAddress[:10], e, candidateNumber, exc_info=True)
             return None
 
+    @staticmethod
+    def persistWallets(evaluationResults: List[WalletEvaluvationResult]) -> Dict[str, Wallet]:
+        """
+        Persist a batch of passed wallets with a few bulk statements per table.
+
+        Flow:
+        1. Fetch and row-lock already known wallets in one query and update them in the same transaction
+        2. Persist all new wallets and their hierarchies in a single transaction
+        3. If the bulk transaction fails, fall back to per-wallet persistence
+
+        Args:
+            evaluationResults: Passed wallet evaluation results
+
+        Returns:
+            Dict of proxyWallet -> persisted Wallet
+        """
+        passedResults = [result for result in evaluationResults if result.passed]
+        if not passedResults:
+            return {}
+
+        persistedWallets: Dict[str, Wallet] = {}
+        categoriesByAddress = {
+            result.walletAddress: WalletPersistenceService.getCategoriesFromCandidate(result, result.candidate.number)
+            for result in passedResults
+        }
+        # Known wallets: one commit for all updates, with a savepoint per wallet so one failure doesn't poison the rest
+        with transaction.atomic():
+            # Lock the known wallet rows until commit; ascending PK so concurrent runs lock in the same order
+            existingWallets = {
+                wallet.proxywallet: wallet
+                for wallet in Wallet.objects.select_for_update(no_key=True)
+                .only(*EXISTING_WALLET_FIELDS)
+                .filter(proxywallet__in=[result.walletAddress for result in passedResults])
+                .order_by('walletsid')
+            }
+
+            for result in passedResults:
+                existingWallet = existingWallets.get(result.walletAddress)
+                if not existingWallet:
+                    continue
+
+                try:
+                    with transaction.atomic():
+                        persistedWallets[result.walletAddress] = WalletPersistenceService.handleExistingWallet(
+                            existingWallet,
+                            result.walletAddress,
+                            categoriesByAddress[result.walletAddress],
+                            result.openPnl,
+                            result.closedPnl,
+                            result.combinedPnl
+                        )
+                except Exception as e:
+                    logger.info("SMART_WALLET_DISCOVERY :: Failed | Wallet: %s | Error: %s - #%d",result.walletAddress[:10], e, result.candidate.number, exc_info=True)
+
+        newResults = [result for result in passedResults if result.walletAddress not in existingWallets]
+        if newResults:
+            try:
+                persistedWallets.update(WalletPersistenceService.persistNewWallets(newResults, categoriesByAddress))
+            except Exception as e:
+                logger.info("SMART_WALLET_DISCOVERY :: Bulk persistence failed, falling back to per-wallet | Wallets: %d | Error: %s",len(newResults), e, exc_info=True)
+                for result in newResults:
+                    wallet = WalletPersistenceService.persistWallet(result, result.candidate.number)
+                    if wallet:
+                        persistedWallets[result.walletAddress] = wallet
+
+        logger.info("SMART_WALLET_DISCOVERY :: Bulk persistence complete | Passed: %d | New: %d | Persisted: %d",len(passedResults), len(newResults), len(persistedWallets))
+        return persistedWallets
+
+    @staticmethod
+    def persistNewWallets(evaluationResults: List[WalletEvaluvationResult], categoriesByAddress: Dict[str, Optional[str]]) -> Dict[str, Wallet]:
+        """
+        Persist new wallets with full hierarchy in one transaction.
+        Events and markets are upserted once for the union of all wallet hierarchies.
+        """
+        firstSeenAt = timezone.now()  # One discovery timestamp for the whole batch
+
+        with transaction.atomic():
+            wallets = [
+                WalletPersistenceService.buildWalletRecord(
+                    result.candidate,
+                    categoriesByAddress.get(result.walletAddress),
+                    result.openPnl,
+                    result.closedPnl,
+                    result.combinedPnl,
+                    firstSeenAt
+                )
+                for result in evaluationResults
+            ]
+            Wallet.objects.bulk_create(wallets, batch_size=WALLET_BULK_BATCH_SIZE)
+
+            # Persist shared hierarchy: Events → Markets
+            mergedHierarchy = WalletPersistenceService.mergeEventHierarchies(
+                [result.eventHierarchy for result in evaluationResults]
+            )
+            eventLookup = WalletPersistenceService.persistEvents(mergedHierarchy)
+            marketLookup = WalletPersistenceService.persistMarkets(mergedHierarchy, eventLookup)
+
+            # Per-wallet rows: Positions → Trades → Batches → PnL
+            positionsToCreate = []
+            tradesToCreate = []
+            batchesToCreate = []
+            pnlToCreate = []
+            for wallet, result in zip(wallets, evaluationResults):
+                walletPositions, walletTrades, walletBatches = WalletPersistenceService.buildHierarchyRows(
+                    wallet, result.eventHierarchy, marketLookup, result.candidate.number
+                )
+                positionsToCreate.extend(walletPositions)
+                tradesToCreate.extend(walletTrades)
+                batchesToCreate.extend(walletBatches)
+                pnlToCreate.append(WalletPnl(wallet=wallet, **WalletPersistenceService.buildPnlData(result, 30)))
+
+            if positionsToCreate:
+                PositionModel.objects.bulk_create(positionsToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+            if tradesToCreate:
+                Trade.objects.bulk_create(tradesToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+            if batchesToCreate:
+                Batch.objects.bulk_create(batchesToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+            WalletPnl.objects.bulk_create(pnlToCreate, batch_size=WALLET_BULK_BATCH_SIZE)
+
+            logger.info("SMART_WALLET_DISCOVERY :: Persisted new wallets | Wallets: %d | Positions: %d | Trades: %d | Batches: %d",
+                       len(wallets), len(positionsToCreate), len(tradesToCreate), len(batchesToCreate))
+            return {wallet.proxywallet: wallet for wallet in wallets}
+
+    @staticmethod
+    def mergeEventHierarchies(eventHierarchies: List[Dict[str, Event]]) -> Dict[str, Event]:
+        """
+        Merge per-wallet event hierarchies into one slug -> Event map for event/market upserts.
+        Events are shallow-copied so wallet hierarchies are left untouched.
+        """
+        mergedHierarchy: Dict[str, Event] = {}
+        for eventHierarchy in eventHierarchies:
+            for eventSlug, event in eventHierarchy.items():
+                mergedEvent = mergedHierarchy.get(eventSlug)
+                if mergedEvent is None:
+                    mergedEvent = mergedHierarchy[eventSlug] = replace(event, markets={})
+                for conditionId, market in event.markets.items():
+                    mergedEvent.markets.setdefault(conditionId, market)
+        return mergedHierarchy
+
     @staticmethod
     def getCategoriesFromCandidate(evaluationResult: WalletEvaluvationResult, candidateNumber: int) -> Optional[str]:     
         """
@@ -190,31 +273,33 @@ class WalletPersistenceService:
         Update existing wallet with merged categories, PnL values, and reactivate if inactive.
         """
         mergedCategories = WalletPersistenceService.mergeCategories(existingWallet.category, newCategories)
+        changedFields = []
 
-        wasInactive = existingWallet.isactive == 0
-        categoriesChanged = mergedCategories != existingWallet.category
-        pnlChanged = (existingWallet.openpnl != openPnl or
-                     existingWallet.closedpnl != closedPnl or
-                     existingWallet.pnl != totalPnl)
-
-        if wasInactive:
+        if existingWallet.isactive == 0:
             existingWallet.isactive = 1
+            changedFields.append('isactive')
             logger.info("SMART_WALLET_DISCOVERY :: Reactivated | Address: %s", walletAddress[:10])
 
-        if categoriesChanged:
-            existingWallet.category = mergedCategories
+        if mergedCategories != existingWallet.category:
             logger.info("SMART_WALLET_DISCOVERY :: Categories merged | Address: %s | %s → %s",
                        walletAddress[:10], existingWallet.category or "None", mergedCategories or "None")
+            existingWallet.category = mergedCategories
+            changedFields.append('category')
 
-        if pnlChanged:
+        if (existingWallet.openpnl != openPnl or
+                existingWallet.closedpnl != closedPnl or
+                existingWallet.pnl != totalPnl):
             existingWallet.openpnl = openPnl
             existingWallet.closedpnl = closedPnl
             existingWallet.pnl = totalPnl
-            logger.info("SMART_WALLET_DISCOVERY :: PnL updated | Address: %s | Total: %.2f (Open: %.2f | Closed: %.2f)",
-                       walletAddress[:10], float(totalPnl), float(openPnl), float(closedPnl))
+            changedFields.extend(('openpnl', 'closedpnl', 'pnl'))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: PnL updated | Address: %s | Total: %s (Open: %s | Closed: %s)",
+                           walletAddress[:10], format(totalPnl, '.2f'), format(openPnl, '.2f'), format(closedPnl, '.2f'))
 
-        if wasInactive or categoriesChanged or pnlChanged:
-            existingWallet.save()
+        if changedFields:
+            # Write only the changed columns (plus the auto_now timestamp)
+            existingWallet.save(update_fields=changedFields + ['lastupdatedat'])
 
         return existingWallet
 
@@ -223,32 +308,31 @@ class WalletPersistenceService:
         """
         Merge and deduplicate categories, returning sorted comma-separated string.
         """
-        categories = set()
-
-        if existing:
-            categories.update(cat.strip() for cat in existing.split(',') if cat.strip())
-        if new:
-            categories.update(cat.strip() for cat in new.split(',') if cat.strip())
-
+        categories = WalletPersistenceService.parseCategories(existing) | WalletPersistenceService.parseCategories(new)
         return ','.join(sorted(categories)) if categories else None
 
     @staticmethod
-    def persistNewWallet(evaluationResult: WalletEvaluvationResult, categories: Optional[str], candidateNumber: int) -> Optional[Wallet]:
+    @lru_cache(maxsize=1024)
+    def parseCategories(categories: Optional[str]) -> FrozenSet[str]:
         """
-        Persist new wallet with full hierarchy using database lock.
+        Parse a comma-separated category string into a set of stripped names.
+        Cached: the same few category combinations recur across most wallets.
         """
-        with transaction.atomic():
-            WalletPersistenceService.acquireLock(SMART_WALLET_DISCOVERY)
-
-            try:
-                wallet = WalletPersistenceService.persistWalletHierarchy(evaluationResult, categories, candidateNumber)
+        if not categories:
+            return frozenset()
+        return frozenset(cat.strip() for cat in categories.split(',') if cat.strip())
 
-                if wallet:
-                    logger.info("SMART_WALLET_DISCOVERY :: Persisted new wallet | Address: %s | Categories: %s - #%d",wallet.proxywallet[:10], categories or "None", candidateNumber)
-                return wallet
+    @staticmethod
+    def persistNewWallet(evaluationResult: WalletEvaluvationResult, categories: Optional[str], candidateNumber: int) -> Optional[Wallet]:
+        """
+        Persist new wallet with full hierarchy.
+        A concurrent insert of the same address fails on the proxywallet unique constraint.
+        """
+        wallet = WalletPersistenceService.persistWalletHierarchy(evaluationResult, categories, candidateNumber)
 
-            finally:
-                WalletPersistenceService.releaseLock(SMART_WALLET_DISCOVERY)
+        if wallet:
+            logger.info("SMART_WALLET_DISCOVERY :: Persisted new wallet | Address: %s | Categories: %s - #%d",wallet.proxywallet[:10], categories or "None", candidateNumber)
+        return wallet
 
     @staticmethod
     def persistWalletHierarchy(evaluationResult: WalletEvaluvationResult, categories: Optional[str], candidateNumber: int) -> Optional[Wallet]:
@@ -268,106 +352,119 @@ class WalletPersistenceService:
                 logger.info("SMART_WALLET_DISCOVERY :: No candidate data - #%d", candidateNumber)
                 return None
 
-            # Create wallet record with PnL values
-            wallet = WalletPersistenceService.createWalletRecord(
-                candidate,
-                categories,
-                evaluationResult.openPnl,
-                evaluationResult.closedPnl,
-                evaluationResult.combinedPnl
-            )
-            if not wallet:
-                return None
+            # All hierarchy steps share the caller's transaction; a failure marks it for rollback (no savepoint needed)
+            with transaction.atomic(savepoint=False):
+                # Create wallet record with PnL values
+                wallet = WalletPersistenceService.createWalletRecord(
+                    candidate,
+                    categories,
+                    evaluationResult.openPnl,
+                    evaluationResult.closedPnl,
+                    evaluationResult.combinedPnl
+                )
+                if not wallet:
+                    return None
 
-            eventHierarchy = evaluationResult.eventHierarchy
+                eventHierarchy = evaluationResult.eventHierarchy
 
-            # Persist hierarchy: Events → Markets → Positions → Trades → Batches
-            eventLookup = WalletPersistenceService.persistEvents(eventHierarchy, candidateNumber)
-            marketLookup = WalletPersistenceService.persistMarkets(eventHierarchy, eventLookup, candidateNumber)
-            WalletPersistenceService.persistPositions(wallet, eventHierarchy, marketLookup, candidateNumber)
-            WalletPersistenceService.persistTrades(wallet, eventHierarchy, marketLookup, candidateNumber)
-            WalletPersistenceService.createBatchRecords(wallet, eventHierarchy, marketLookup, candidateNumber)
+                # Persist hierarchy: Events → Markets → Positions → Trades → Batches
+                eventLookup = WalletPersistenceService.persistEvents(eventHierarchy, candidateNumber)
+                marketLookup = WalletPersistenceService.persistMarkets(eventHierarchy, eventLookup, candidateNumber)
+                positionCount, tradeCount, batchCount = WalletPersistenceService.persistHierarchyRows(wallet, eventHierarchy, marketLookup, candidateNumber)
 
-            # Persist 30-day PnL data (already calculated during discovery)
-            WalletPersistenceService.persistPnlData(wallet, evaluationResult, candidateNumber, 30)
+                # Persist 30-day PnL data (already calculated during discovery)
+                WalletPersistenceService.persistPnlData(wallet, evaluationResult, candidateNumber, 30)
 
-            # Mark wallet as processed
-            wallet.wallettype = WalletType.OLD
-            wallet.save()
+                logger.info("SMART_WALLET_DISCOVERY :: Persisted hierarchy | Wallet: %s | Events: %d | Markets: %d | Positions: %d | Trades: %d | Batches: %d - #%d",
+                           wallet.proxywallet[:10], len(eventLookup), len(marketLookup), positionCount, tradeCount, batchCount, candidateNumber)
 
-            return wallet
+                return wallet
 
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Persistence failed | Error: %s - #%d", str(e), candidateNumber, exc_info=True)
+            logger.info("SMART_WALLET_DISCOVERY :: Persistence failed | Error: %s - #%d", e, candidateNumber, exc_info=True)
             return None
 
     @staticmethod
     def getExistingWallet(walletAddress: str, candidateNumber: int) -> Optional[Wallet]:
         try:
-            return Wallet.objects.filter(proxywallet=walletAddress).first()
+            # NO KEY UPDATE still lets rows referencing the wallet (positions, pnl) be written concurrently
+            return Wallet.objects.select_for_update(no_key=True).only(*EXISTING_WALLET_FIELDS).filter(proxywallet=walletAddress).first()
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Error fetching wallet: %s - #%d", str(e), candidateNumber)
+            logger.info("SMART_WALLET_DISCOVERY :: Error fetching wallet: %s - #%d", e, candidateNumber)
             return None
 
     @staticmethod
-    def createWalletRecord(candidate, categories: Optional[str], openPnl: Decimal, closedPnl: Decimal, totalPnl: Decimal) -> Optional[Wallet]:
+    def buildWalletRecord(candidate: WalletCandidate, categories: Optional[str], openPnl: Decimal, closedPnl: Decimal, totalPnl: Decimal,
+                          firstSeenAt: Optional[datetime] = None) -> Wallet:
+        """
+        Build unsaved wallet record with comma-separated categories and PnL values.
+        Inserted directly as OLD (processed): its hierarchy commits in the same transaction,
+        so no reader ever sees the wallet without it and no NEW → OLD update is needed.
+        """
+        return Wallet(
+            proxywallet=candidate.proxyWallet,
+            category=categories,
+            username=candidate.username or f"User_{candidate.proxyWallet[:8]}",
+            xusername=candidate.xUsername,
+            verifiedbadge=candidate.verifiedBadge,
+            profileimage=candidate.profileImage,
+            platform='polymarket',
+            wallettype=WalletType.OLD,
+            isactive=1,
+            openpnl=openPnl,
+            closedpnl=closedPnl,
+            pnl=totalPnl,
+            firstseenat=firstSeenAt or timezone.now()
+        )
+
+    @staticmethod
+    def createWalletRecord(candidate: WalletCandidate, categories: Optional[str], openPnl: Decimal, closedPnl: Decimal, totalPnl: Decimal) -> Optional[Wallet]:
         """
         Create new wallet record with comma-separated categories and PnL values.
         """
         try:
-            wallet = Wallet.objects.create(
-                proxywallet=candidate.proxyWallet,
-                category=categories,
-                username=candidate.username or f"User_{candidate.proxyWallet[:8]}",
-                xusername=getattr(candidate, 'xUsername', None),
-                verifiedbadge=getattr(candidate, 'verifiedBadge', False),
-                profileimage=getattr(candidate, 'profileImage', None),
-                platform='polymarket',
-                wallettype=WalletType.NEW,
-                isactive=1,
-                openpnl=openPnl,
-                closedpnl=closedPnl,
-                pnl=totalPnl,
-                firstseenat=timezone.now()
-            )
+            wallet = WalletPersistenceService.buildWalletRecord(candidate, categories, openPnl, closedPnl, totalPnl)
+            wallet.save(force_insert=True)
 
-            logger.info("SMART_WALLET_DISCOVERY :: Created wallet | Address: %s | Categories: %s | PnL: %.2f (Open: %.2f | Closed: %.2f)",
-                       wallet.proxywallet[:10], categories or "None", float(totalPnl), float(openPnl), float(closedPnl))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: Created wallet | Address: %s | Categories: %s | PnL: %s (Open: %s | Closed: %s)",
+                           wallet.proxywallet[:10], categories or "None", format(totalPnl, '.2f'), format(openPnl, '.2f'), format(closedPnl, '.2f'))
 
             return wallet
 
         except Exception as e:
-            logger.error("SMART_WALLET_DISCOVERY :: Failed to create wallet | Error: %s", str(e))
+            logger.error("SMART_WALLET_DISCOVERY :: Failed to create wallet | Error: %s", e)
             return None
 
     @staticmethod
     def persistEvents(eventHierarchy: Dict[str, Event], candidateNumber: int=None) -> Dict[str, EventModel]:
         """
         Persist all events using bulk upsert.
-        1. Bulk create/update all events (1 query)
-        2. Fetch all events for lookup (1 query)
+        1. Bulk create/update all events (1 query per batch)
+        2. Build lookup from the upserted objects (PKs returned by the upsert)
         """
         if not eventHierarchy:
             return {}
 
-        eventSlugs = list(eventHierarchy.keys())
+        now = timezone.now()  # Shared fallback for missing event dates
 
-        # Prepare all events for upsert (both new and existing)
+        # Prepare all events for upsert (both new and existing), in slug order so concurrent
+        # upserts lock shared rows in the same order instead of deadlocking
         eventsToUpsert = []
-        for eventSlug, event in eventHierarchy.items():
+        for eventSlug, event in sorted(eventHierarchy.items()):
             eventObj = EventModel(
                 eventslug=eventSlug,
                 platformeventid=event.platformEventId or 0,
                 title=event.title or f'Event {eventSlug}',
                 description=event.description or '',
-                liquidity=event.liquidity or Decimal('0'),
-                volume=event.volume or Decimal('0'),
-                openInterest=event.openInterest or Decimal('0'),
-                marketcreatedat=event.marketCreatedAt or timezone.now(),
-                marketupdatedat=event.marketUpdatedAt or timezone.now(),
-                competitive=event.competitive or Decimal('0'),
+                liquidity=event.liquidity or _ZERO,
+                volume=event.volume or _ZERO,
+                openInterest=event.openInterest or _ZERO,
+                marketcreatedat=event.marketCreatedAt or now,
+                marketupdatedat=event.marketUpdatedAt or now,
+                competitive=event.competitive or _ZERO,
                 negrisk=1 if event.negRisk else 0,
-                startdate=event.startDate or timezone.now(),
+                startdate=event.startDate or now,
                 enddate=event.endDate,
                 platform='polymarket',
                 tags=event.tags or []
@@ -381,46 +478,44 @@ class WalletPersistenceService:
                 update_conflicts=True,
                 update_fields=['title', 'description', 'liquidity', 'volume', 'openInterest',
                               'marketupdatedat', 'competitive', 'negrisk', 'enddate'],
-                unique_fields=['eventslug']
+                unique_fields=['eventslug'],
+                batch_size=WALLET_BULK_BATCH_SIZE
             )
-            logger.info("SMART_WALLET_DISCOVERY :: Upserted %d events", len(eventsToUpsert))
 
-        # Fetch all events for lookup
-        allEvents = EventModel.objects.filter(eventslug__in=eventSlugs).all()
-        eventLookup = {event.eventslug: event for event in allEvents}
-
-        if candidateNumber is not None:
-            logger.info("SMART_WALLET_DISCOVERY :: Events lookup: %d | Candidate #%d", len(eventLookup), candidateNumber)
+        # Upserted rows carry their PKs via RETURNING (PostgreSQL); only re-select if the backend didn't set them
+        if all(event.pk is not None for event in eventsToUpsert):
+            eventLookup = {event.eventslug: event for event in eventsToUpsert}
         else:
-            logger.info("SMART_WALLET_DISCOVERY :: Events lookup: %d", len(eventLookup))
+            eventLookup = EventModel.objects.in_bulk(list(eventHierarchy), field_name='eventslug')
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SMART_WALLET_DISCOVERY :: Upserted events: %d | Lookup: %d - #%s", len(eventsToUpsert), len(eventLookup), candidateNumber)
         return eventLookup
 
     @staticmethod
     def persistMarkets(eventHierarchy: Dict[str, Event],eventLookup: Dict[str, EventModel], candidateNumber: int=None) -> Dict[str, MarketModel]:
         """
         Persist all markets using bulk upsert.
-        1. Bulk create/update all markets (1 query)
-        2. Fetch all markets for lookup (1 query)
+        1. Bulk create/update all markets (1 query per batch)
+        2. Build lookup from the upserted objects (PKs returned by the upsert)
         """
         if not eventHierarchy:
             return {}
 
-        # Collect all condition IDs
-        allConditionIds = []
-        for event in eventHierarchy.values():
-            allConditionIds.extend(event.markets.keys())
+        now = timezone.now()  # Shared fallback for missing market dates
 
-        # Prepare all markets for upsert (both new and existing)
-        marketsToUpsert = []
+        # Prepare all markets for upsert, keyed by conditionId: a market listed under two events
+        # would otherwise hit the same row twice in one ON CONFLICT DO UPDATE (last one wins)
+        marketsByConditionId: Dict[str, MarketModel] = {}
         for eventSlug, event in eventHierarchy.items():
             eventModel = eventLookup.get(eventSlug)
 
             for conditionId, market in event.markets.items():
                 # Convert empty strings to None for datetime fields
-                endDate = market.endDate if market.endDate and market.endDate != "" else None
-                closedTime = market.closedTime if market.closedTime and market.closedTime != "" else None
-                startDate = market.startDate if market.startDate and market.startDate != "" else None
-                marketCreatedAt = market.marketCreatedAt if market.marketCreatedAt and market.marketCreatedAt != "" else None
+                endDate = market.endDate or None
+                closedTime = market.closedTime or None
+                startDate = market.startDate or None
+                marketCreatedAt = market.marketCreatedAt or None
 
                 marketObj = MarketModel(
                     platformmarketid=conditionId,
@@ -428,16 +523,18 @@ class WalletPersistenceService:
                     marketid=market.marketId or 0,
                     marketslug=market.marketSlug or f'market_{conditionId[:10]}',
                     question=market.question or f'Market {conditionId[:10]}',
-                    startdate=startDate or timezone.now(),
+                    startdate=startDate or now,
                     enddate=endDate,
-                    marketcreatedat=marketCreatedAt or timezone.now(),
+                    marketcreatedat=marketCreatedAt or now,
                     closedtime=closedTime,
-                    volume=market.volume or Decimal('0'),
-                    liquidity=market.liquidity or Decimal('0'),
+                    volume=market.volume or _ZERO,
+                    liquidity=market.liquidity or _ZERO,
                     competitive=market.competitive,
                     platform='polymarket'
                 )
-                marketsToUpsert.append(marketObj)
+                marketsByConditionId[conditionId] = marketObj
+
+        marketsToUpsert = [marketsByConditionId[conditionId] for conditionId in sorted(marketsByConditionId)]  # Stable lock order
 
         # Bulk upsert: insert new, update existing
         if marketsToUpsert:
@@ -445,25 +542,93 @@ class WalletPersistenceService:
                 marketsToUpsert,
                 update_conflicts=True,
                 update_fields=['question', 'enddate', 'closedtime', 'volume', 'liquidity', 'competitive'],
-                unique_fields=['platformmarketid']
+                unique_fields=['platformmarketid'],
+                batch_size=WALLET_BULK_BATCH_SIZE
             )
-            logger.info("SMART_WALLET_DISCOVERY :: Upserted %d markets", len(marketsToUpsert))
-
-        # Fetch all markets for lookup
-        allMarkets = MarketModel.objects.filter(platformmarketid__in=allConditionIds).all()
-        marketLookup = {market.platformmarketid: market for market in allMarkets}
 
-        if candidateNumber is not None:
-            logger.info("SMART_WALLET_DISCOVERY :: Markets lookup: %d | Candidate #%d", len(marketLookup), candidateNumber)
+        # Upserted rows carry their PKs via RETURNING (PostgreSQL); only re-select if the backend didn't set them
+        if all(market.pk is not None for market in marketsToUpsert):
+            marketLookup = marketsByConditionId
         else:
-            logger.info("SMART_WALLET_DISCOVERY :: Markets lookup: %d", len(marketLookup))
+            marketLookup = MarketModel.objects.in_bulk(list(marketsByConditionId), field_name='platformmarketid')
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SMART_WALLET_DISCOVERY :: Upserted markets: %d | Lookup: %d - #%s", len(marketsToUpsert), len(marketLookup), candidateNumber)
         return marketLookup
 
+    @staticmethod
+    def persistHierarchyRows(wallet: Wallet,eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int) -> Tuple[int, int, int]:
+        """Persist positions, trades and batch records for one wallet from a single hierarchy walk; returns their counts."""
+        positionsToCreate, tradesToCreate, batchesToCreate = WalletPersistenceService.buildHierarchyRows(wallet, eventHierarchy, marketLookup, candidateNumber)
+
+        if positionsToCreate:
+            PositionModel.objects.bulk_create(positionsToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+        if tradesToCreate:
+            Trade.objects.bulk_create(tradesToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+        if batchesToCreate:
+            Batch.objects.bulk_create(batchesToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+
+        return len(positionsToCreate), len(tradesToCreate), len(batchesToCreate)
+
     @staticmethod
     def persistPositions(wallet: Wallet,eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int=None) -> None:
         """Persist all positions with proper foreign keys."""
         positionsToCreate = []
+        for conditionId, market, marketModel in WalletPersistenceService.iterResolvedMarkets(eventHierarchy, marketLookup, candidateNumber):
+            positionsToCreate.extend(WalletPersistenceService.buildPositionRows(wallet, market, marketModel, candidateNumber))
 
+        # Bulk create positions
+        if positionsToCreate:
+            PositionModel.objects.bulk_create(positionsToCreate, ignore_conflicts=True, batch_size=WALLET_BULK_BATCH_SIZE)
+            if candidateNumber is not None:
+                logger.info("SMART_WALLET_DISCOVERY :: Positions created: %d | %s | Candidate #%d", len(positionsToCreate), wallet.proxywallet[:10], candidateNumber)
+            else:
+                logger.info("SMART_WALLET_DISCOVERY :: Positions created: %d | %s", len(positionsToCreate), wallet.proxywallet[:10])
+
+    @staticmethod
+    def buildHierarchyRows(wallet: Wallet,eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int=None) -> Tuple[List[PositionModel], List[Trade], List[Batch]]:
+        """
+        Build unsaved Position, Trade and Batch objects in one walk over the hierarchy.
+        Trades and batch records only exist for markets that have dailyTrades data.
+        """
+        positionsToCreate = []
+        tradesToCreate = []
+        batchesToCreate = []
+        fetchedTime = int(time.time())  # Same fetch time for every batch record of this wallet
+
+        for conditionId, market, marketModel in WalletPersistenceService.iterResolvedMarkets(eventHierarchy, marketLookup, candidateNumber):
+            positionsToCreate.extend(WalletPersistenceService.buildPositionRows(wallet, market, marketModel, candidateNumber))
+
+            if not market.dailyTrades:
+                continue  # No trades or batch needed
+
+            tradesToCreate.extend(
+                Trade(
+                    walletsid=wallet,
+                    marketsid=marketModel,
+                    conditionid=conditionId,
+                    tradetype=aggregatedTrade.tradeType.value,
+                    outcome=aggregatedTrade.outcome,
+                    totalshares=aggregatedTrade.totalShares,
+                    totalamount=aggregatedTrade.totalAmount,
+                    tradedate=aggregatedTrade.tradeDate,
+                    transactioncount=aggregatedTrade.transactionCount
+                )
+                for aggregatedTrade in chain.from_iterable(dailyTrades.iterTrades() for dailyTrades in market.dailyTrades.values())
+            )
+
+            batchesToCreate.append(Batch(
+                walletsid=wallet,
+                marketsid=marketModel,
+                latestfetchedtime=fetchedTime,
+                isactive=1
+            ))
+
+        return positionsToCreate, tradesToCreate, batchesToCreate
+
+    @staticmethod
+    def iterResolvedMarkets(eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int=None) -> Iterator[Tuple[str, Market, MarketModel]]:
+        """Yield (conditionId, market, marketModel) for every market in the hierarchy that has a persisted model."""
         for event in eventHierarchy.values():
             for conditionId, market in event.markets.items():
                 marketModel = marketLookup.get(conditionId)
@@ -473,26 +638,24 @@ class WalletPersistenceService:
                     else:
                         logger.warning("SMART_WALLET_DISCOVERY :: No market model: %s", conditionId[:10])
                     continue
+                yield conditionId, market, marketModel
 
-                for position in market.positions:
-                    positionObj = WalletPersistenceService.createPositionObject(wallet,marketModel,position, candidateNumber)
-                    if positionObj:
-                        positionsToCreate.append(positionObj)
-
-        # Bulk create positions
-        if positionsToCreate:
-            PositionModel.objects.bulk_create(positionsToCreate, ignore_conflicts=True)
-            if candidateNumber is not None:
-                logger.info("SMART_WALLET_DISCOVERY :: Positions created: %d | %s | Candidate #%d", len(positionsToCreate), wallet.proxywallet[:10], candidateNumber)
-            else:
-                logger.info("SMART_WALLET_DISCOVERY :: Positions created: %d | %s", len(positionsToCreate), wallet.proxywallet[:10])
+    @staticmethod
+    def buildPositionRows(wallet: Wallet,market: Market,marketModel: MarketModel, candidateNumber: int=None) -> List[PositionModel]:
+        """Build unsaved Position objects for one market."""
+        positionsToCreate = []
+        for position in market.positions:
+            positionObj = WalletPersistenceService.createPositionObject(wallet,marketModel,position, candidateNumber)
+            if positionObj:
+                positionsToCreate.append(positionObj)
+        return positionsToCreate
 
     @staticmethod
     def createPositionObject(wallet: Wallet,marketModel: MarketModel,position: Position, candidateNumber: int) -> Optional[PositionModel]:
         """Create Position model object from Position POJO."""
         try:
             # Convert empty string to None for datetime field
-            endDate = position.endDate if position.endDate and position.endDate != "" else None
+            endDate = position.endDate or None
 
             return PositionModel(
                 walletsid=wallet,
@@ -509,11 +672,11 @@ class WalletPersistenceService:
                 amountspent=position.amountSpent,
                 amountremaining=position.amountRemaining,
                 apirealizedpnl=position.apiRealizedPnl,
-                realizedpnl=position.realizedPnl or Decimal('0'),
-                unrealizedpnl=position.unrealizedPnl or Decimal('0'),
-                calculatedamountinvested=position.calculatedAmountInvested or Decimal('0'),
-                calculatedamountout=position.calculatedAmountTakenOut or Decimal('0'),
-                calculatedcurrentvalue=position.calculatedCurrentValue or Decimal('0'),
+                realizedpnl=position.realizedPnl or _ZERO,
+                unrealizedpnl=position.unrealizedPnl or _ZERO,
+                calculatedamountinvested=position.calculatedAmountInvested or _ZERO,
+                calculatedamountout=position.calculatedAmountTakenOut or _ZERO,
+                calculatedcurrentvalue=position.calculatedCurrentValue or _ZERO,
                 enddate=endDate,
                 timestamp=position.timestamp,
                 negativerisk=position.negativeRisk
@@ -521,117 +684,15 @@ class WalletPersistenceService:
 
         except Exception as e:
             if candidateNumber is not None:
-                logger.info("SMART_WALLET_DISCOVERY :: Failed to create position: %s | Candidate #%d", str(e), candidateNumber)
+                logger.info("SMART_WALLET_DISCOVERY :: Failed to create position: %s | Candidate #%d", e, candidateNumber)
             else:
-                logger.info("SMART_WALLET_DISCOVERY :: Failed to create position: %s", str(e))
+                logger.info("SMART_WALLET_DISCOVERY :: Failed to create position: %s", e)
             return None
 
-    @staticmethod
-    def persistTrades(wallet: Wallet,eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int) -> None:
-        """Persist all trades from markets that have dailyTrades data."""
-        tradesToCreate = []
-
-        for event in eventHierarchy.values():
-            for conditionId, market in event.markets.items():
-                if not market.dailyTrades:
-                    continue  # No trades to persist
-
-                marketModel = marketLookup.get(conditionId)
-                if not marketModel:
-                    continue
-
-                # Persist all daily trades
-                for dailyTrades in market.dailyTrades.values():
-                    for aggregatedTrade in dailyTrades.getAllTrades():
-                        tradeObj = Trade(
-                            walletsid=wallet,
-                            marketsid=marketModel,
-                            conditionid=conditionId,
-                            tradetype=aggregatedTrade.tradeType.value,
-                            outcome=aggregatedTrade.outcome,
-                            totalshares=aggregatedTrade.totalShares,
-                            totalamount=aggregatedTrade.totalAmount,
-                            tradedate=aggregatedTrade.tradeDate,
-                            transactioncount=aggregatedTrade.transactionCount
-                        )
-                        tradesToCreate.append(tradeObj)
-
-        # Bulk create trades
-        if tradesToCreate:
-            Trade.objects.bulk_create(tradesToCreate, ignore_conflicts=True)
-            logger.info("SMART_WALLET_DISCOVERY :: Trades created: %d | Wallet: %s - #%d",len(tradesToCreate), wallet.proxywallet[:10], candidateNumber)
-
-    @staticmethod
-    def createBatchRecords(wallet: Wallet,eventHierarchy: Dict[str, Event],marketLookup: Dict[str, MarketModel], candidateNumber: int) -> None:
-        """Create batch records for markets with fetched trades."""
-        batchesToCreate = []
-
-        for event in eventHierarchy.values():
-            for conditionId, market in event.markets.items():
-                if not market.dailyTrades:
-                    continue  # No batch needed
-
-                marketModel = marketLookup.get(conditionId)
-                if not marketModel:
-                    continue
-
-                batchObj = Batch(
-                    walletsid=wallet,
-                    marketsid=marketModel,
-                    latestfetchedtime=int(datetime.now().timestamp()),
-                    isactive=1
-                )
-                batchesToCreate.append(batchObj)
-
-        # Bulk create batches
-        if batchesToCreate:
-            Batch.objects.bulk_create(batchesToCreate, ignore_conflicts=True)
-            logger.info("SMART_WALLET_DISCOVERY :: Batch records created: %d | Wallet: %s - #%d",len(batchesToCreate), wallet.proxywallet[:10], candidateNumber)
-
     @staticmethod
     def persistPnlData(wallet: Wallet, evaluationResult: WalletEvaluvationResult, candidateNumber: int,period: int) -> None:
         try:
-            # Calculate 30-day period
-            now = timezone.now()
-            periodStart = now - timezone.timedelta(days=period)
-            periodEnd = now
-
-            # Calculate winrates
-            realizedWinrate, realizedWinrateOdds = WalletPersistenceService.calculateWinrate(
-                evaluationResult.realizedWins,
-                evaluationResult.realizedLosses
-            )
-            unrealizedWinrate, unrealizedWinrateOdds = WalletPersistenceService.calculateWinrate(
-                evaluationResult.unrealizedWins,
-                evaluationResult.unrealizedLosses
-            )
-            # High volume winrate - for now, use same as realized (can be customized later)
-            highVolumeWinrate, highVolumeWinrateOdds = WalletPersistenceService.calculateWinrate(
-                evaluationResult.realizedWins,
-                evaluationResult.realizedLosses
-            )
-
-            # Use amounts from evaluationResult (already calculated during discovery)
-            pnlData = {
-                'period': period,
-                'start': periodStart,
-                'end': periodEnd,
-                'openamountinvested': evaluationResult.openAmountInvested,
-                'openamountout': evaluationResult.openAmountOut,
-                'opencurrentvalue': evaluationResult.openCurrentValue,
-                'closedamountinvested': evaluationResult.closedAmountInvested,
-                'closedamountout': evaluationResult.closedAmountOut,
-                'closedcurrentvalue': evaluationResult.closedCurrentValue,
-                'totalinvestedamount': evaluationResult.totalInvestedAmount,
-                'totalamountout': evaluationResult.totalAmountOut,
-                'currentvalue': evaluationResult.totalCurrentValue,
-                'realizedwinrateodds': realizedWinrateOdds,
-                'realizedwinrate': realizedWinrate,
-                'unrealizedwinrateodds': unrealizedWinrateOdds,
-                'unrealizedwinrate': unrealizedWinrate,
-                'highvolumewinrateodds': highVolumeWinrateOdds,
-                'highvolumewinrate': highVolumeWinrate
-            }
+            pnlData = WalletPersistenceService.buildPnlData(evaluationResult, period)
 
             # Create or update PnL record
             pnlRecord, created = WalletPnl.objects.update_or_create(
@@ -641,23 +702,69 @@ class WalletPersistenceService:
             )
 
             action = "Created" if created else "Updated"
-            logger.info("SMART_WALLET_DISCOVERY :: %s 30-day PnL | Wallet: %s | Total Invested: %.2f | Current Value: %.2f | Realized WR: %s | Unrealized WR: %s - #%d",
-                action,
-                wallet.proxywallet[:10],
-                float(evaluationResult.totalInvestedAmount),
-                float(evaluationResult.totalCurrentValue),
-                realizedWinrateOdds or "N/A",
-                unrealizedWinrateOdds or "N/A",
-                candidateNumber
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: %s 30-day PnL | Wallet: %s | Total Invested: %s | Current Value: %s | Realized WR: %s | Unrealized WR: %s - #%d",
+                    action,
+                    wallet.proxywallet[:10],
+                    format(evaluationResult.totalInvestedAmount, '.2f'),
+                    format(evaluationResult.totalCurrentValue, '.2f'),
+                    pnlData['realizedwinrateodds'] or "N/A",
+                    pnlData['unrealizedwinrateodds'] or "N/A",
+                    candidateNumber
+                )
 
         except Exception as e:
             logger.info("SMART_WALLET_DISCOVERY :: Failed to persist PnL data | Wallet: %s | Error: %s - #%d",wallet.proxywallet[:10],
-                str(e),
+                e,
                 candidateNumber,
                 exc_info=True
             )
 
+    @staticmethod
+    def buildPnlData(evaluationResult: WalletEvaluvationResult, period: int) -> Dict:
+        """Build WalletPnl field values for the given period from evaluation amounts."""
+        # Calculate period window
+        now = timezone.now()
+        periodStart = now - timezone.timedelta(days=period)
+        periodEnd = now
+
+        # Calculate winrates
+        realizedWinrate, realizedWinrateOdds = WalletPersistenceService.calculateWinrate(
+            evaluationResult.realizedWins,
+            evaluationResult.realizedLosses
+        )
+        unrealizedWinrate, unrealizedWinrateOdds = WalletPersistenceService.calculateWinrate(
+            evaluationResult.unrealizedWins,
+            evaluationResult.unrealizedLosses
+        )
+        # High volume winrate - for now, use same as realized (can be customized later)
+        highVolumeWinrate, highVolumeWinrateOdds = WalletPersistenceService.calculateWinrate(
+            evaluationResult.realizedWins,
+            evaluationResult.realizedLosses
+        )
+
+        # Use amounts from evaluationResult (already calculated during discovery)
+        return {
+            'period': period,
+            'start': periodStart,
+            'end': periodEnd,
+            'openamountinvested': evaluationResult.openAmountInvested,
+            'openamountout': evaluationResult.openAmountOut,
+            'opencurrentvalue': evaluationResult.openCurrentValue,
+            'closedamountinvested': evaluationResult.closedAmountInvested,
+            'closedamountout': evaluationResult.closedAmountOut,
+            'closedcurrentvalue': evaluationResult.closedCurrentValue,
+            'totalinvestedamount': evaluationResult.totalInvestedAmount,
+            'totalamountout': evaluationResult.totalAmountOut,
+            'currentvalue': evaluationResult.totalCurrentValue,
+            'realizedwinrateodds': realizedWinrateOdds,
+            'realizedwinrate': realizedWinrate,
+            'unrealizedwinrateodds': unrealizedWinrateOdds,
+            'unrealizedwinrate': unrealizedWinrate,
+            'highvolumewinrateodds': highVolumeWinrateOdds,
+            'highvolumewinrate': highVolumeWinrate
+        }
+
     @staticmethod
     def calculateWinrate(wins: int, losses: int) -> Tuple[Optional[Decimal], Optional[str]]:
         """
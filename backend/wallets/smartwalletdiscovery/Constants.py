@@ -2,16 +2,17 @@
 Constants for Smart Wallet Discovery.
 Contains blacklist of wallet addresses to exclude from discovery process.
 """
-from typing import Set
+from typing import FrozenSet
 
 # Blacklisted wallet addresses (proxy wallets)
 # Wallets in this list will be filtered out during candidate fetching
 # and will not be evaluated or persisted to the database
-BLACKLISTED_WALLETS: Set[str] = {
+# Stored lowercased: addresses may arrive checksummed (mixed case) or lowercase
+BLACKLISTED_WALLETS: FrozenSet[str] = frozenset(address.lower() for address in (
     # Add wallet addresses here to blacklist them
     # Example: "0x1234567890abcdef1234567890abcdef12345678"
-}
+))
 
 
 def isWalletBlacklisted(walletAddress: str) -> bool:
-    return walletAddress in BLACKLISTED_WALLETS
+    return walletAddress.lower() in BLACKLISTED_WALLETS
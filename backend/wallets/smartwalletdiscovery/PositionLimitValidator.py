@@ -4,7 +4,10 @@ Position Limit Validation Utilities.
 Simple, modular functions for validating position counts against limits.
 """
 import logging
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional, Tuple
 from dateutil import parser as dateParser
 
@@ -18,7 +21,7 @@ from wallets.Constants import (
 logger = logging.getLogger(__name__)
 
 
-def countValidOpenPositions(openPositions: List[PolymarketPositionResponse]) -> int:
+def countValidOpenPositions(openPositions: List[PolymarketPositionResponse], stopAfter: Optional[int] = None) -> int:
     """
     Count open positions where endDate > current UTC time.
     
@@ -30,27 +33,23 @@ def countValidOpenPositions(openPositions: List[PolymarketPositionResponse]) ->
     
     Args:
         openPositions: List of open positions
+        stopAfter: Optional limit; counting stops once the count exceeds it
         
     Returns:
-        Count of valid open positions with future endDate
+        Count of valid open positions with future endDate (at most stopAfter + 1)
     """
-    currentUtcTimestamp = int(datetime.now(timezone.utc).timestamp())
-    count = 0
-    
-    for position in openPositions:
-        if position.positionType != PositionStatus.OPEN:
-            continue
-            
-        endDateTimestamp = _parseEndDateToTimestamp(position.endDate)
-        if endDateTimestamp is None:
-            # Missing or invalid endDate - ignore in counting
-            continue
-            
-        # Count only if endDate is in the future
-        if endDateTimestamp > currentUtcTimestamp:
-            count += 1
-            
-    return count
+    currentUtcTimestamp = int(time.time())  # Epoch seconds are UTC; no datetime needed
+
+    # Missing or invalid endDate parses to None and is ignored in counting
+    validPositions = (
+        position for position in openPositions
+        if position.positionType == PositionStatus.OPEN
+        and (endDateTimestamp := _parseEndDateToTimestamp(position.endDate)) is not None
+        and endDateTimestamp > currentUtcTimestamp
+    )
+    if stopAfter is not None:
+        validPositions = islice(validPositions, stopAfter + 1)
+    return sum(1 for _ in validPositions)
 
 
 def validatePositionLimits(
@@ -74,11 +73,12 @@ def validatePositionLimits(
         - failureReason: None if valid, descriptive string if invalid
     """
     # Validate open positions
-    openCount = countValidOpenPositions(openPositions)
+    # Stop counting once over the limit; the reason then reports the lower bound ("at least N"), not the exact count
+    openCount = countValidOpenPositions(openPositions, stopAfter=MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE)
     if openCount > MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE:
         reason = (
             f"Open positions with future endDate exceed limit | "
-            f"Count: {openCount} | Limit: {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE}"
+            f"Count: at least {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE + 1} | Limit: {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE}"
         )
         logPrefix = f"Candidate #{candidateNumber} | " if candidateNumber is not None else ""
         logger.info(
@@ -120,6 +120,7 @@ def validatePositionLimits(
     return True, None
 
 
+@lru_cache(maxsize=4096)
 def _parseEndDateToTimestamp(endDate: Optional[str]) -> Optional[int]:
     """
     Parse endDate string to Unix timestamp at end of day (23:59:59).
@@ -128,18 +129,27 @@ def _parseEndDateToTimestamp(endDate: Optional[str]) -> Optional[int]:
     - "YYYY-MM-DD" (e.g., "2026-12-31")
     - "YYYY-MM-DDTHH:MM:SSZ" (e.g., "1970-01-01T00:00:00Z")
     
+    Both are ISO 8601, parsed with datetime.fromisoformat; dateutil is only
+    the fallback for ISO-shaped strings fromisoformat rejects. Anything not
+    starting with "YYYY-MM-DD" is treated as invalid without parsing.
+    Cached because positions on the same market share endDates.
+    
     Args:
         endDate: Date string or None
         
     Returns:
         Unix timestamp at 23:59:59.999999 of the date, or None if parsing fails
     """
-    if not endDate:
+    if not endDate or len(endDate) < 10 or endDate[4] != '-' or endDate[7] != '-':
+        # Missing or not date-shaped - reject without an exception round trip
         return None
         
     try:
-        # Parse the date string (handles both formats)
-        parsedDate = dateParser.parse(endDate)
+        # Parse the date string (fast path covers both known formats)
+        try:
+            parsedDate = datetime.fromisoformat(endDate)
+        except ValueError:
+            parsedDate = dateParser.parse(endDate)
         
         # Set time to end of day (23:59:59.999999)
         endOfDay = parsedDate.replace(
@@ -161,6 +171,6 @@ def _parseEndDateToTimestamp(endDate: Optional[str]) -> Optional[int]:
         logger.debug(
             "POSITION_LIMIT_VALIDATOR :: Failed to parse endDate: %s | Error: %s",
             endDate,
-            str(e)
+            e
         )
         return None
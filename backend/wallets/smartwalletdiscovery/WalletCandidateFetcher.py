@@ -3,10 +3,15 @@ Fetches candidate wallets from Polymarket leaderboard using period='all'.
 Filters out blacklisted wallets during discovery process.
 """
 import logging
+import threading
 import time
+import orjson
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import List
+from queue import Queue
+from typing import Iterator, List
 from wallets.pojos.WalletCandidate import WalletCandidate
 from wallets.implementations.polymarket.Constants import (
     POLYMARKET_API_BASE_URL,
@@ -14,12 +19,26 @@ from wallets.implementations.polymarket.Constants import (
     POLYMARKET_HEADERS,
     SMART_MONEY_CATEGORIES
 )
+from wallets.Constants import LEADERBOARD_PAGE_LIMIT, LEADERBOARD_PREFETCH_DEPTH
 from wallets.smartwalletdiscovery.Constants import isWalletBlacklisted
 from framework.RateLimitedRequestHandler import RateLimitedRequestHandler
 from framework.RateLimiterType import RateLimiterType
 
 logger = logging.getLogger(__name__)
 
+_END_OF_CATEGORY = object()  # Queue sentinel: one category walk has finished
+_ZERO = Decimal('0')
+
+
+def _toDecimal(value) -> Decimal:
+    """
+    Convert a decoded JSON number to Decimal.
+    Only floats go through str (keeps their shortest repr); ints and strings convert directly.
+    """
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return Decimal(value) if value else _ZERO
+
 
 class WalletCandidateFetcher:
     """
@@ -27,7 +46,8 @@ class WalletCandidateFetcher:
     Uses production-grade rate limiting with connection pooling.
     """
 
-    def __init__(self):
+    def __init__(self, pageLimit: int = LEADERBOARD_PAGE_LIMIT):
+        self.pageLimit = pageLimit
         self.baseUrl = POLYMARKET_API_BASE_URL
         self.endpoint = POLYMARKET_LEADERBOARD_ENDPOINT
         self.headers = POLYMARKET_HEADERS.copy()
@@ -42,16 +62,30 @@ class WalletCandidateFetcher:
         Paginate through leaderboard until PNL drops below threshold.
         Tracks categories for each wallet across multiple category leaderboards.
 
+        Returns list of WalletCandidate POJOs with categories populated.
+        """
+        candidates = [candidate for page in self.fetchCandidatesIter(minPnl) for candidate in page]
+        logger.info("SMART_WALLET_DISCOVERY :: Discovery completed | Total candidates: %d", len(candidates))
+        return candidates
+
+    def fetchCandidatesIter(self, minPnl: float) -> Iterator[List[WalletCandidate]]:
+        """
+        Paginate through leaderboard, yielding the new candidates of each page as soon as it is fetched.
+
         API: /v1/leaderboard?timePeriod=all&orderBy=PNL
 
+        Categories are walked concurrently (one worker per category); pages are merged
+        here, on the consuming thread, so numbering and category tracking need no locks.
+
         Stops when:
         - PNL < minPnl threshold
         - No more results
 
-        Returns list of WalletCandidate POJOs with categories populated.
+        Wallets already yielded from an earlier category get the new category appended
+        in place, so categories are complete once iteration finishes.
         """
         seenWallets = {}  # Dict[walletAddress, WalletCandidate] for category tracking
-        limit = 50
+        limit = self.pageLimit
         walletCounter = 0  # Counter for numbering wallets
 
         # Use all available categories to maximize coverage
@@ -59,19 +93,84 @@ class WalletCandidateFetcher:
 
         logger.info("SMART_WALLET_DISCOVERY :: Starting candidate discovery | MinPNL: %d", minPnl)
 
-        for category in categories:
-            logger.info("SMART_WALLET_DISCOVERY :: Fetching category: %s", category)
+        pageQueue: Queue = Queue()
+        stopEvent = threading.Event()
+
+        with ThreadPoolExecutor(max_workers=len(categories), thread_name_prefix="leaderboard") as executor:
+            futures = [
+                executor.submit(self.fetchCategoryPages, category, minPnl, limit, pageQueue, stopEvent)
+                for category in categories
+            ]
+            try:
+                activeCategories = len(futures)
+                while activeCategories:
+                    page = pageQueue.get()
+                    if page is _END_OF_CATEGORY:
+                        activeCategories -= 1
+                        continue
+
+                    category, batchData = page
+                    pageCandidates = []
 
-            categoryOffset = 0
+                    for walletData in batchData:
+                        walletAddress = walletData['proxyWallet']
 
-            while True:
-                batchData = self.fetchPage(category, categoryOffset, limit)
+                        # Skip blacklisted wallets
+                        if isWalletBlacklisted(walletAddress):
+                            logger.info("SMART_WALLET_DISCOVERY :: Wallet blacklisted, skipping | Wallet: %s", walletAddress[:10])
+                            continue
+
+                        if walletAddress in seenWallets:
+                            # Wallet seen in another category - append category
+                            if category not in seenWallets[walletAddress].categories:
+                                seenWallets[walletAddress].categories.append(category)
+                        else:
+                            # New wallet - create candidate and add category
+                            walletCounter += 1
+                            candidate = self._parseToCandidate(walletData, category)
+                            candidate.number = walletCounter
+                            seenWallets[walletAddress] = candidate
+                            pageCandidates.append(candidate)
+                            logger.info("SMART_WALLET_DISCOVERY :: Candidate #%d | Wallet: %s", walletCounter, walletAddress)
+
+                    if pageCandidates:
+                        yield pageCandidates
+            finally:
+                # Consumer stopped early (or a category failed): let the other walks end after their current page
+                stopEvent.set()
+
+            # Surface the first category failure, as the serial walk did
+            for future in futures:
+                future.result()
+
+    def fetchCategoryPages(self, category: str, minPnl: float, limit: int, pageQueue: Queue, stopEvent: threading.Event) -> None:
+        """
+        Walk one category's leaderboard on a worker thread, queueing each page's rows above minPnl.
+        Always queues _END_OF_CATEGORY last, even on failure.
+
+        Pages are requested LEADERBOARD_PREFETCH_DEPTH ahead and processed in offset order;
+        once the threshold or the last page is reached, requests not yet started are cancelled.
+        At most LEADERBOARD_PREFETCH_DEPTH - 1 speculative pages are fetched past the end.
+        """
+        logger.info("SMART_WALLET_DISCOVERY :: Fetching category: %s", category)
+
+        nextOffset = 0
+        inFlight = deque()  # Futures of pending pages, in offset order
+        prefetcher = ThreadPoolExecutor(max_workers=LEADERBOARD_PREFETCH_DEPTH, thread_name_prefix=f"leaderboard-{category}")
+        try:
+            while not stopEvent.is_set():
+                while len(inFlight) < LEADERBOARD_PREFETCH_DEPTH:
+                    inFlight.append(prefetcher.submit(self.fetchPage, category, nextOffset, limit))
+                    nextOffset += limit
+
+                batchData = inFlight.popleft().result()
 
                 if not batchData:
                     logger.info("SMART_WALLET_DISCOVERY :: No more data for category: %s", category)
                     break
 
                 foundLowPnl = False
+                qualifyingRows = []
 
                 for walletData in batchData:
                     pnl = float(walletData.get('pnl', 0))
@@ -81,39 +180,28 @@ class WalletCandidateFetcher:
                         foundLowPnl = True
                         break
 
-                    walletAddress = walletData['proxyWallet']
-
-                    # Skip blacklisted wallets
-                    if isWalletBlacklisted(walletAddress):
-                        logger.info("SMART_WALLET_DISCOVERY :: Wallet blacklisted, skipping | Wallet: %s", walletAddress[:10])
-                        continue
+                    qualifyingRows.append(walletData)
 
-                    if walletAddress in seenWallets:
-                        # Wallet seen in another category - append category
-                        if category not in seenWallets[walletAddress].categories:
-                            seenWallets[walletAddress].categories.append(category)
-                    else:
-                        # New wallet - create candidate and add category
-                        walletCounter += 1
-                        candidate = self._parseToCandidate(walletData, category)
-                        candidate.number = walletCounter
-                        seenWallets[walletAddress] = candidate
-                        logger.info("SMART_WALLET_DISCOVERY :: Candidate #%d | Wallet: %s", walletCounter, walletAddress)
+                if qualifyingRows:
+                    pageQueue.put((category, qualifyingRows))
 
                 if foundLowPnl:
                     break
 
-                categoryOffset += limit
-
                 if len(batchData) < limit:
                     logger.info("SMART_WALLET_DISCOVERY :: Last batch for category: %s | Records: %d",category, len(batchData))
                     break
+        except Exception:
+            stopEvent.set()  # One failed category fails the discovery; stop the others early
+            raise
+        finally:
+            # Speculative pages past the stop point are not needed
+            for future in inFlight:
+                future.cancel()
+            prefetcher.shutdown(wait=True, cancel_futures=True)
+            pageQueue.put(_END_OF_CATEGORY)
 
-        candidates = list(seenWallets.values())
-        logger.info("SMART_WALLET_DISCOVERY :: Discovery completed | Total candidates: %d", len(candidates))
-        return candidates
-
-    def fetchPage(self, category: str, offset: int, limit: int = 50) -> List[dict]:
+    def fetchPage(self, category: str, offset: int, limit: int = LEADERBOARD_PAGE_LIMIT) -> List[dict]:
         """
         Fetch single page from leaderboard API with rate limiting and automatic retries.
         """
@@ -136,7 +224,7 @@ class WalletCandidateFetcher:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)  # Decodes the raw bytes directly, faster than response.json()
                 logger.info("SMART_WALLET_DISCOVERY :: API call successful | Category: %s | Records: %d",category,len(data) if isinstance(data, list) else 0)
                 return data
 
@@ -150,7 +238,7 @@ class WalletCandidateFetcher:
                 raise Exception(f"{errorMsg}: {response.text}")
 
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Failed to fetch page | Category: %s | Offset: %d | Error: %s",category,offset,str(e))
+            logger.info("SMART_WALLET_DISCOVERY :: Failed to fetch page | Category: %s | Offset: %d | Error: %s",category,offset,e)
             raise
 
     def _parseToCandidate(self, apiResponse: dict, category: str) -> WalletCandidate:
@@ -162,8 +250,8 @@ class WalletCandidateFetcher:
         return WalletCandidate(
             proxyWallet=apiResponse['proxyWallet'],
             username=apiResponse.get('userName', ''),
-            allTimePnl=Decimal(str(apiResponse.get('pnl', 0))),
-            allTimeVolume=Decimal(str(apiResponse.get('vol', 0))),
+            allTimePnl=_toDecimal(apiResponse.get('pnl')),
+            allTimeVolume=_toDecimal(apiResponse.get('vol')),
             profileImage=apiResponse.get('profileImage'),
             xUsername=apiResponse.get('xUsername'),
             verifiedBadge=apiResponse.get('verifiedBadge', False),
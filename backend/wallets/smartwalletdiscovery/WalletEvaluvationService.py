@@ -43,6 +43,7 @@ from wallets.Constants import (
 )
 
 logger = logging.getLogger(__name__)
+_ZERO = Decimal('0')
 
 
 class PositionLimitExceededException(Exception):
@@ -93,8 +94,9 @@ class WalletEvaluvationService:
             cutoffTimestamp = self.getCutoffTimestamp()
             self.processMarketsForPnl(walletAddress, walletEvaluvationResult, cutoffTimestamp, candidate.number)
 
-            logger.info("SMART_WALLET_DISCOVERY :: Metrics calculated | Total PNL: %.2f | Open: %.2f | Closed: %.2f | Trades: %d | Positions: %d | Wallet: %s - #%d",
-                       float(walletEvaluvationResult.combinedPnl), float(walletEvaluvationResult.openPnl), float(walletEvaluvationResult.closedPnl), walletEvaluvationResult.tradeCount, walletEvaluvationResult.positionCount, walletAddress[:10], candidate.number)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: Metrics calculated | Total PNL: %s | Open: %s | Closed: %s | Trades: %d | Positions: %d | Wallet: %s - #%d",
+                           format(walletEvaluvationResult.combinedPnl, '.2f'), format(walletEvaluvationResult.openPnl, '.2f'), format(walletEvaluvationResult.closedPnl, '.2f'), walletEvaluvationResult.tradeCount, walletEvaluvationResult.positionCount, walletAddress[:10], candidate.number)
 
             # Step 4: Apply filters
             if not self.passesActivityFilter(walletEvaluvationResult.tradeCount, walletEvaluvationResult.positionCount):
@@ -108,8 +110,9 @@ class WalletEvaluvationService:
             # All filters passed
             walletEvaluvationResult.passed = True
 
-            logger.info("SMART_WALLET_DISCOVERY :: Wallet PASSED | Total PNL: %.2f | Open: %.2f | Closed: %.2f | Trades: %d | Positions: %d | Wallet: %s - #%d",
-                       float(walletEvaluvationResult.combinedPnl), float(walletEvaluvationResult.openPnl), float(walletEvaluvationResult.closedPnl), walletEvaluvationResult.tradeCount, walletEvaluvationResult.positionCount, walletAddress[:10], candidate.number)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SMART_WALLET_DISCOVERY :: Wallet PASSED | Total PNL: %s | Open: %s | Closed: %s | Trades: %d | Positions: %d | Wallet: %s - #%d",
+                           format(walletEvaluvationResult.combinedPnl, '.2f'), format(walletEvaluvationResult.openPnl, '.2f'), format(walletEvaluvationResult.closedPnl, '.2f'), walletEvaluvationResult.tradeCount, walletEvaluvationResult.positionCount, walletAddress[:10], candidate.number)
 
             return walletEvaluvationResult
 
@@ -122,11 +125,11 @@ class WalletEvaluvationService:
                 candidate=candidate
             )
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Evaluation failed | Wallet: %s | Error: %s - #%d",walletAddress[:10], str(e), candidate.number, exc_info=True)
+            logger.info("SMART_WALLET_DISCOVERY :: Evaluation failed | Wallet: %s | Error: %s - #%d",walletAddress[:10], e, candidate.number, exc_info=True)
             return WalletEvaluvationResult.create(
                 walletAddress=walletAddress,
                 passed=False,
-                failReason=f"Evaluation error: {str(e)[:100]}",
+                failReason=f"Evaluation error: {e!s:.100}",
                 candidate=candidate
             )
 
@@ -140,10 +143,10 @@ class WalletEvaluvationService:
         # Fetch open positions first (with limit checking)
         openPositions = self.openPositionAPI.fetchOpenPositionsWithLimitCheck(walletAddress, candidateNumber)
         
-        # Validate open positions limit
-        validOpenCount = countValidOpenPositions(openPositions)
+        # Validate open positions limit (counting stops past the limit, so the reason reports a lower bound)
+        validOpenCount = countValidOpenPositions(openPositions, stopAfter=MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE)
         if validOpenCount > MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE:
-            reason = (f"Open positions with future endDate exceed limit | Count: {validOpenCount} | Limit: {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE}")
+            reason = (f"Open positions with future endDate exceed limit | Count: at least {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE + 1} | Limit: {MAX_OPEN_POSITIONS_WITH_FUTURE_END_DATE}")
             logger.info("SMART_WALLET_DISCOVERY :: REJECTED | Candidate #%d | Wallet: %s | %s",candidateNumber,walletAddress[:10],reason)
             raise PositionLimitExceededException(reason)
         
@@ -191,15 +194,14 @@ class WalletEvaluvationService:
 
             # Get or create Market within Event
             if conditionId not in event.markets:
-                endDate = getattr(apiPosition, 'endDate', None)
+                endDate = apiPosition.endDate
                 # Normalize endDate format (handle both 'YYYY-MM-DD' and 'YYYY-MM-DDTHH:MM:SSZ')
                 if endDate and endDate != "":
                     try:
-                        from dateutil import parser as date_parser
                         # Parse the date string (handles both formats)
                         endDate = date_parser.parse(endDate)
                     except Exception as e:
-                        logger.info("SMART_WALLET_DISCOVERY :: Failed to parse endDate: %s | Error: %s - #%d", endDate, str(e), candidateNumber)
+                        logger.info("SMART_WALLET_DISCOVERY :: Failed to parse endDate: %s | Error: %s - #%d", endDate, e, candidateNumber)
                         endDate = None
                 else:
                     endDate = None
@@ -294,18 +296,18 @@ class WalletEvaluvationService:
         - Trade and position counts
         - Amount breakdowns (invested, out, current value) for open and closed positions
         """
-        totalPnl = Decimal('0')
-        openPnl = Decimal('0')
-        closedPnl = Decimal('0')
+        totalPnl = _ZERO
+        openPnl = _ZERO
+        closedPnl = _ZERO
         tradeCount = 0
         positionCount = 0
 
         # Amount accumulators
-        openInvested = Decimal('0')
-        openOut = Decimal('0')
-        openCurrentValue = Decimal('0')
-        closedInvested = Decimal('0')
-        closedOut = Decimal('0')
+        openInvested = _ZERO
+        openOut = _ZERO
+        openCurrentValue = _ZERO
+        closedInvested = _ZERO
+        closedOut = _ZERO
 
         # Win/loss accumulators
         realizedWins = 0
@@ -325,7 +327,8 @@ class WalletEvaluvationService:
                     marketPnl, marketTradeCount, mktInvested, mktOut, mktCurrentValue = self.processMarketWithOpenPositions(
                         walletAddress, market, conditionId, cutoffTimestamp, candidateNumber
                     )
-                    logger.info("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %.2f | Open PNL: %.2f | PNL to be added: %.2f - #%d",market.question, float(totalPnl or 0), float(openPnl or 0), float(marketPnl or 0), candidateNumber)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %s | Open PNL: %s | PNL to be added: %s - #%d",market.question, format(totalPnl or 0, '.2f'), format(openPnl or 0, '.2f'), format(marketPnl or 0, '.2f'), candidateNumber)
                     if marketPnl is not None:
                         openPnl += marketPnl
                         totalPnl += marketPnl
@@ -342,11 +345,13 @@ class WalletEvaluvationService:
                         elif marketPnl < 0:
                             unrealizedLosses += marketPositionCount
                             totalBets += marketPositionCount
-                    logger.info("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %.2f | Open PNL: %.2f | PNL added: %.2f - #%d",market.question, float(totalPnl or 0), float(openPnl or 0), float(marketPnl or 0), candidateNumber)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %s | Open PNL: %s | PNL added: %s - #%d",market.question, format(totalPnl or 0, '.2f'), format(openPnl or 0, '.2f'), format(marketPnl or 0, '.2f'), candidateNumber)
                 else:
                     # Market has only closed positions - use API PNL
                     marketPnl, mktInvested, mktOut = self.processMarketWithClosedPositions(market, cutoffTimestamp, candidateNumber)
-                    logger.info("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %.2f | Closed PNL: %.2f | PNL to be added: %.2f - #%d",market.question, float(totalPnl or 0), float(closedPnl or 0), float(marketPnl or 0), candidateNumber)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %s | Closed PNL: %s | PNL to be added: %s - #%d",market.question, format(totalPnl or 0, '.2f'), format(closedPnl or 0, '.2f'), format(marketPnl or 0, '.2f'), candidateNumber)
                     if marketPnl is not None:
                         closedPnl += marketPnl
                         totalPnl += marketPnl
@@ -362,7 +367,8 @@ class WalletEvaluvationService:
                         elif marketPnl < 0:
                             realizedLosses += marketPositionCount
                             totalBets += marketPositionCount
-                    logger.info("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %.2f | Closed PNL: %.2f | PNL added: %.2f - #%d",market.question, float(totalPnl or 0), float(closedPnl or 0), float(marketPnl or 0), candidateNumber)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("SMART_WALLET_DISCOVERY :: Market: %s | Total PNL: %s | Closed PNL: %s | PNL added: %s - #%d",market.question, format(totalPnl or 0, '.2f'), format(closedPnl or 0, '.2f'), format(marketPnl or 0, '.2f'), candidateNumber)
 
         # Populate evaluation result with all calculated values
         evaluationResult.combinedPnl = totalPnl
@@ -375,7 +381,7 @@ class WalletEvaluvationService:
         evaluationResult.openCurrentValue = openCurrentValue
         evaluationResult.closedAmountInvested = closedInvested
         evaluationResult.closedAmountOut = closedOut
-        evaluationResult.closedCurrentValue = Decimal('0')  # Always 0 for closed
+        evaluationResult.closedCurrentValue = _ZERO  # Always 0 for closed
         evaluationResult.totalInvestedAmount = openInvested + closedInvested
         evaluationResult.totalAmountOut = openOut + closedOut
         evaluationResult.totalCurrentValue = openCurrentValue  # Only open has current value
@@ -393,7 +399,7 @@ class WalletEvaluvationService:
 
             if not dailyTradesMap:
                 logger.info("SMART_WALLET_DISCOVERY :: No trades for market with open positions: %s | Wallet: %s - #%d", market.question, walletAddress[:10], candidateNumber)
-                return None, 0, Decimal('0'), Decimal('0'), Decimal('0')
+                return None, 0, _ZERO, _ZERO, _ZERO
 
             logger.info("SMART_WALLET_DISCOVERY :: Trades fetched for market with open positions, market: %s | trades: %d | Wallet: %s - #%d", market.question, len(dailyTradesMap), walletAddress[:10], candidateNumber)
 
@@ -410,29 +416,30 @@ class WalletEvaluvationService:
             if hasTradesInRange or hasClosedInRange:
                 # Count trades in range
                 tradesInRange = sum(
-                    len(dailyTrades.getAllTrades())
+                    dailyTrades.getTradeCount()
                     for tradeDate, dailyTrades in dailyTradesMap.items()
                     if int(datetime.combine(tradeDate, datetime.min.time()).timestamp()) >= cutoffTimestamp
                 )
 
-                logger.info("SMART_WALLET_DISCOVERY :: Market with open positions IN RANGE | Market: %s | PNL: %.2f | Trades: %d | Wallet: %s - #%d",market.question, float(market.calculatedPnl or 0), tradesInRange, walletAddress[:10], candidateNumber)
-                logger.info("SMART_WALLET_DISCOVERY :: Market : %s | open-inrange: %s | closed-inrange : %s | Wallet: %s - #%d" ,market.question, hasTradesInRange, hasClosedInRange, walletAddress[:10], candidateNumber)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("SMART_WALLET_DISCOVERY :: Market with open positions IN RANGE | Market: %s | PNL: %s | Trades: %d | Wallet: %s - #%d",market.question, format(market.calculatedPnl or 0, '.2f'), tradesInRange, walletAddress[:10], candidateNumber)
+                    logger.debug("SMART_WALLET_DISCOVERY :: Market : %s | open-inrange: %s | closed-inrange : %s | Wallet: %s - #%d" ,market.question, hasTradesInRange, hasClosedInRange, walletAddress[:10], candidateNumber)
 
                 # Return amounts from market (calculated by calculateMarketPnlFromTrades)
                 return (
                     market.calculatedPnl,
                     tradesInRange,
-                    market.calculatedAmountInvested or Decimal('0'),
-                    market.calculatedAmountTakenOut or Decimal('0'),
-                    market.calculatedCurrentValue or Decimal('0')
+                    market.calculatedAmountInvested or _ZERO,
+                    market.calculatedAmountTakenOut or _ZERO,
+                    market.calculatedCurrentValue or _ZERO
                 )
             else:
-                logger.info("SMART_WALLET_DISCOVERY :: Market with open positions NOT in range: %s | Wallet: %s - #%d", market.question, walletAddress[:10], candidateNumber)
-                return None, 0, Decimal('0'), Decimal('0'), Decimal('0')
+                logger.debug("SMART_WALLET_DISCOVERY :: Market with open positions NOT in range: %s | Wallet: %s - #%d", market.question, walletAddress[:10], candidateNumber)
+                return None, 0, _ZERO, _ZERO, _ZERO
 
         except Exception as e:
-            logger.info("SMART_WALLET_DISCOVERY :: Error processing market %s: %s | Wallet: %s - #%d", market.question, str(e), walletAddress[:10], candidateNumber)
-            return None, 0, Decimal('0'), Decimal('0'), Decimal('0')
+            logger.info("SMART_WALLET_DISCOVERY :: Error processing market %s: %s | Wallet: %s - #%d", market.question, e, walletAddress[:10], candidateNumber)
+            return None, 0, _ZERO, _ZERO, _ZERO
 
     def processMarketWithClosedPositions(self, market: Market, cutoffTimestamp: int, candidateNumber: int) -> Tuple[Optional[Decimal], Decimal, Decimal]:
         """
@@ -443,10 +450,10 @@ class WalletEvaluvationService:
         """
         # Calculate PNL from API realizedPnl
         marketPnl = sum(
-            (pos.apiRealizedPnl or Decimal('0')) for pos in market.positions
+            (pos.apiRealizedPnl or _ZERO) for pos in market.positions
         )
         marketTotalInvested = sum(
-            (pos.amountSpent or Decimal('0')) for pos in market.positions
+            (pos.amountSpent or _ZERO) for pos in market.positions
         )
         marketTotalTakenOut = marketPnl + marketTotalInvested
 
@@ -461,11 +468,12 @@ class WalletEvaluvationService:
 
         # Check if any closed position is in range (check both endDate and timestamp)
         if self.hasClosedPositionsInRange(market.positions, cutoffTimestamp):
-            logger.info("SMART_WALLET_DISCOVERY :: Market with all closed positions IN RANGE | Market: %s | PNL: %.2f - #%d",market.question, float(marketPnl), candidateNumber)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("SMART_WALLET_DISCOVERY :: Market with all closed positions IN RANGE | Market: %s | PNL: %s - #%d",market.question, format(marketPnl, '.2f'), candidateNumber)
             return marketPnl, marketTotalInvested, marketTotalTakenOut
         else:
-            logger.info("SMART_WALLET_DISCOVERY :: Market with all closed positions NOT in range: %s - #%d", market.question, candidateNumber)
-            return None, Decimal('0'), Decimal('0')
+            logger.debug("SMART_WALLET_DISCOVERY :: Market with all closed positions NOT in range: %s - #%d", market.question, candidateNumber)
+            return None, _ZERO, _ZERO
 
     def hasTradesInRange(self, dailyTradesMap: Dict, cutoffTimestamp: int) -> bool:
         """
@@ -558,7 +566,6 @@ class WalletEvaluvationService:
 
         try:
             if isinstance(endDate, str):
-                from dateutil import parser as date_parser
                 endDateTime = date_parser.parse(endDate)
             else:
                 endDateTime = endDate
@@ -567,7 +574,7 @@ class WalletEvaluvationService:
             endOfDay = endDateTime.replace(hour=23, minute=59, second=59, microsecond=999999)
             return int(endOfDay.timestamp())
         except Exception as e:
-            logger.warning("WALLET_EVAL :: Failed to parse endDate: %s | Error: %s", endDate, str(e))
+            logger.warning("WALLET_EVAL :: Failed to parse endDate: %s | Error: %s", endDate, e)
             return None
 
     def isPositionInRange(self,positionCloseTimestamp: Optional[int],positionEndDateTimestamp: Optional[int],cutoffTimestamp: int) -> bool:
@@ -636,7 +643,7 @@ class WalletEvaluvationService:
                         tradesData[conditionId] = (dailyTradesMap, latestTimestamp)
                 except Exception as e:
                     logger.warning("WALLET_EVAL :: Failed to fetch trades | Market: %s | Error: %s",
-                                 conditionId[:10], str(e))
+                                 conditionId[:10], e)
 
         return tradesData
 
@@ -672,7 +679,7 @@ class WalletEvaluvationService:
 
         except Exception as e:
             logger.error("WALLET_EVAL :: Error fetching trades | Market: %s | Error: %s",
-                        conditionId[:10], str(e))
+                        conditionId[:10], e)
             return None, None
 
     def calculateMarketPnlFromTrades(self, market: Market, dailyTradesMap: Dict, candidateNumber: int) -> None:
@@ -680,12 +687,12 @@ class WalletEvaluvationService:
         Calculate PNL for market from trades and set on both market and all positions.
         All positions in the market get the same market-level values.
         """
-        totalInvested = Decimal('0')
-        totalTakenOut = Decimal('0')
+        totalInvested = _ZERO
+        totalTakenOut = _ZERO
 
         # Aggregate amounts from all trades
         for dailyTrades in dailyTradesMap.values():
-            for aggregatedTrade in dailyTrades.getAllTrades():
+            for aggregatedTrade in dailyTrades.iterTrades():
                 tradeType = aggregatedTrade.tradeType
                 amount = abs(aggregatedTrade.totalAmount)
 
@@ -712,7 +719,8 @@ class WalletEvaluvationService:
             position.setPnlCalculations(totalInvested, totalTakenOut, marketPnl, currentValue)
             position.tradeStatus = TradeStatus.TRADES_SYNCED
 
-        logger.info("SMART_WALLET_DISCOVERY :: Market PNL calculated | Market: %s | PNL: %.2f | Invested: %.2f | Out: %.2f - #%d",market.question, float(marketPnl), float(totalInvested), float(totalTakenOut), candidateNumber)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SMART_WALLET_DISCOVERY :: Market PNL calculated | Market: %s | PNL: %s | Invested: %s | Out: %s - #%d",market.question, format(marketPnl, '.2f'), format(totalInvested, '.2f'), format(totalTakenOut, '.2f'), candidateNumber)
 
     def passesActivityFilter(self, tradeCount: int, positionCount: int) -> bool:
         """Check if wallet passes activity thresholds."""
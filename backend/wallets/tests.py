@@ -0,0 +1,183 @@
+"""
+Tests for the smart wallet discovery pipeline.
+Run the leaderboard fetch, candidate stream and parallel evaluation against a mocked
+leaderboard API and a mocked evaluator - no network, no database.
+"""
+import random
+import threading
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from wallets.smartwalletdiscovery import WalletCandidateFetcher as fetcherModule
+from wallets.smartwalletdiscovery.WalletCandidateFetcher import WalletCandidateFetcher
+from wallets.services.SmartWalletDiscoveryService import SmartWalletDiscoveryService
+from wallets.pojos.WalletCandidate import WalletCandidate
+from wallets.pojos.WalletEvaluvationResult import WalletEvaluvationResult
+
+PAGE_LIMIT = 50
+TIMEOUT_SECONDS = 30  # A hung pipeline fails the test instead of blocking the run
+
+
+class MockLeaderboard:
+    """
+    Leaderboard API stand-in: PNL decreases with rank, later offsets answer faster,
+    so prefetched pages complete out of order.
+    """
+
+    def __init__(self, rowCount: int, failAtOffset: int = None):
+        self.rowCount = rowCount
+        self.failAtOffset = failAtOffset
+
+    def fetchPage(self, category: str, offset: int, limit: int = PAGE_LIMIT):
+        time.sleep(random.uniform(0, 0.02) + max(0, 0.05 - offset / 5000))
+        if offset == self.failAtOffset:
+            raise Exception(f"Mock API failure | Offset: {offset}")
+        return [
+            {'proxyWallet': f'0x{category}{rank:06d}', 'pnl': 100000 - rank, 'vol': 1000, 'rank': rank}
+            for rank in range(offset, min(offset + limit, self.rowCount))
+        ]
+
+
+def buildCandidate(number: int) -> WalletCandidate:
+    return WalletCandidate(
+        proxyWallet=f'0x{number:040x}',
+        username=f'user{number}',
+        allTimePnl=Decimal('50000'),
+        allTimeVolume=Decimal('100000'),
+        number=number
+    )
+
+
+def runWithTimeout(function, *args):
+    """Run function on a worker thread; a deadlock becomes a failure after TIMEOUT_SECONDS."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome['result'] = function(*args)
+        except BaseException as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(TIMEOUT_SECONDS)
+    if worker.is_alive():
+        raise AssertionError(f"{function.__name__} did not finish within {TIMEOUT_SECONDS}s")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+class WalletCandidateFetcherTests(SimpleTestCase):
+    """Concurrent category walks and in-category page prefetch."""
+
+    def fetchCandidates(self, leaderboard: MockLeaderboard, minPnl: float):
+        fetcher = WalletCandidateFetcher()
+        originalCategories = fetcherModule.SMART_MONEY_CATEGORIES
+        try:
+            with patch.object(fetcherModule, 'SMART_MONEY_CATEGORIES', ["crypto", "politics"]), \
+                    patch.object(fetcher, 'fetchPage', leaderboard.fetchPage):
+                return runWithTimeout(fetcher.fetchCandidates, minPnl)
+        finally:
+            self.assertIs(fetcherModule.SMART_MONEY_CATEGORIES, originalCategories)
+
+    def testPrefetchedPagesStayInOrder(self):
+        minPnl = 100000 - 637  # Threshold falls inside a page, past several prefetch windows
+        candidates = self.fetchCandidates(MockLeaderboard(rowCount=2000), minPnl)
+
+        for category in ("crypto", "politics"):
+            ranks = [candidate.rank for candidate in candidates if candidate.categories == [category]]
+            self.assertEqual(ranks, list(range(638)), f"{category}: ranks out of order or missing")
+
+        self.assertEqual([candidate.number for candidate in candidates], list(range(1, len(candidates) + 1)))
+        self.assertTrue(all(isinstance(candidate.allTimePnl, Decimal) for candidate in candidates))
+
+    def testCategoryFailureSurfaces(self):
+        with self.assertRaisesRegex(Exception, "Mock API failure"):
+            self.fetchCandidates(MockLeaderboard(rowCount=2000, failAtOffset=3 * PAGE_LIMIT), 0)
+
+
+class SmartWalletDiscoveryServiceTests(SimpleTestCase):
+    """Candidate producer stream and parallel evaluation with bulk persistence."""
+
+    def setUp(self):
+        self.service = SmartWalletDiscoveryService()
+        self.persistedResults = []
+        self.service.evaluvationService.evaluateWallet = self.evaluateWallet
+        self.service.persistenceService.persistWallets = self.persistWallets
+        self.service.filterExistingActiveWallets = lambda candidates: candidates  # Skip the DB read
+
+    @staticmethod
+    def evaluateWallet(candidate: WalletCandidate) -> WalletEvaluvationResult:
+        """Every 10th candidate raises, every other 3rd is rejected, the rest pass."""
+        time.sleep(random.uniform(0, 0.005))
+        if candidate.number % 10 == 0:
+            raise Exception("Mock evaluation failure")
+        if candidate.number % 3 == 0:
+            return WalletEvaluvationResult(walletAddress=candidate.proxyWallet, passed=False,
+                                           failReason="Insufficient activity | Trades: 0")
+        return WalletEvaluvationResult(walletAddress=candidate.proxyWallet, passed=True,
+                                       positionCount=2, candidate=candidate)
+
+    def persistWallets(self, results):
+        self.persistedResults.extend(results)
+        return {result.walletAddress: SimpleNamespace(walletsid=result.candidate.number, category=None) for result in results}
+
+    def testProducerFailureDeliversSentinel(self):
+        def failingPages(minPnl):
+            yield [buildCandidate(1), buildCandidate(2)]
+            raise Exception("Mock producer failure")
+
+        self.service.candidateFetcher.fetchCandidatesIter = failingPages
+        received = []
+
+        def consume():
+            for candidate in self.service.streamCandidates(0):
+                received.append(candidate.number)
+
+        with self.assertRaisesRegex(Exception, "Mock producer failure"):
+            runWithTimeout(consume)
+        self.assertEqual(received, [1, 2])
+
+    def testWorkerErrorsAreCounted(self):
+        candidateCount = 200
+        metrics = runWithTimeout(self.service.processCandidates, (buildCandidate(number) for number in range(1, candidateCount + 1)))
+
+        errors = candidateCount // 10
+        rejected = sum(1 for number in range(1, candidateCount + 1) if number % 3 == 0 and number % 10)
+        passed = candidateCount - errors - rejected
+
+        self.assertEqual(metrics.totalProcessed, candidateCount)
+        self.assertEqual(metrics.passedEvaluation, passed)
+        self.assertEqual(metrics.rejectedCount, errors + rejected)
+        self.assertEqual(dict(metrics.rejectionReasons), {'processing_error': errors, 'activity': rejected})
+        self.assertEqual(len(self.persistedResults), passed)
+        self.assertEqual(metrics.successfullyPersisted, passed)
+        self.assertEqual(metrics.positionsPersisted, 2 * passed)
+
+    def testToDictIsReadOnly(self):
+        metrics = runWithTimeout(self.service.processCandidates, (buildCandidate(number) for number in range(1, 31)))
+        snapshot = metrics.toDict()
+        expected = {**snapshot, 'rejectionReasons': dict(snapshot['rejectionReasons'])}
+
+        metrics.recordRejected("Insufficient activity | Trades: 0")
+        metrics.recordProcessingError()
+        metrics.recordPassed(5)
+
+        self.assertEqual(snapshot, expected)
+        self.assertNotEqual(metrics.toDict(), snapshot)
+
+    def testStreamFailurePersistsEvaluatedWallets(self):
+        def failingCandidates():
+            yield from (buildCandidate(number) for number in range(1, 21))
+            raise Exception("Mock stream failure")
+
+        with self.assertRaisesRegex(Exception, "Mock stream failure"):
+            runWithTimeout(self.service.processCandidates, failingCandidates())
+
+        passed = sum(1 for number in range(1, 21) if number % 10 and number % 3)
+        self.assertEqual(len(self.persistedResults), passed)
@@ -189,7 +189,7 @@ def evaluateWalletsOnDemand(request: Request) -> Response:
             'wallets_persisted': metrics.successfullyPersisted,
             'positions_persisted': metrics.positionsPersisted,
             'execution_time_seconds': executionTime,
-            'rejection_reasons': metrics.rejectionReasons
+            'rejection_reasons': dict(metrics.rejectionReasons)
         }
 
         logger.info("SMART_WALLET_DISCOVERY :: On-demand processing complete | Qualified: %d | Persisted: %d",